@@ -100,8 +100,10 @@ def configure_app(app):
     app.logger.propagate = False
 
     if app.config["USE_REDIS_JOBS"]:
-        app.redis = redis.Redis.from_url(app.config["REDIS_URL"])
-        app.test_q = Queue("test", connection=app.redis)
+        # REDIS_URL is None when REDIS_HOST is not set, see `_build_redis_url`
+        if app.config.get("REDIS_URL") is not None:
+            app.redis = redis.Redis.from_url(app.config["REDIS_URL"])
+            app.test_q = Queue("test", connection=app.redis)
         with app.app_context():
             from ..ingest.rq_cli import init_rq_cmds
             from ..ingest.cli import init_ingest_cmds
@@ -6,16 +6,18 @@ from time import mktime
 from functools import wraps
 
 import numpy as np
-import networkx as nx
 import requests
 from flask import current_app, json, request
 from scipy import spatial
+from scipy.sparse import csgraph
+from scipy.sparse import csr_matrix
 from werkzeug.datastructures import ImmutableMultiDict
 
 from pychunkedgraph import __version__
 from pychunkedgraph.graph import ChunkedGraph
 from pychunkedgraph.graph.client import get_default_client_info
 from pychunkedgraph.graph import exceptions as cg_exceptions
+from pychunkedgraph.app.config import BaseConfig
 
 
 PCG_CACHE = {}
@@ -34,6 +36,8 @@ def remap_public(func=None, *, edit=False, check_node_ids=False):
         @wraps(f)
         def decorated_function(*args, **kwargs):
             virtual_tables = current_app.config.get("VIRTUAL_TABLES", None)
+            if virtual_tables is None:
+                virtual_tables = BaseConfig.virtual_tables()
 
             # if not virtual configuration just return
             if virtual_tables is None:
@@ -149,6 +153,13 @@ def ensure_correct_version(cg: ChunkedGraph) -> bool:
         return False
 
 
+def get_auth_token():
+    auth_token = current_app.config.get("AUTH_TOKEN", None)
+    if auth_token is None:
+        auth_token = BaseConfig.auth_token()
+    return auth_token
+
+
 def get_cg(table_id, skip_cache: bool = False):
     current_app.table_id = table_id
     if skip_cache is False:
@@ -221,12 +232,14 @@ def handle_supervoxel_id_lookup(
     """
 
     def ccs(coordinates_nm_):
-        graph = nx.Graph()
         dist_mat = spatial.distance.cdist(coordinates_nm_, coordinates_nm_)
-        for edge in np.array(np.where(dist_mat < 1000)).T:
-            graph.add_edge(*edge)
-        ccs = [np.array(list(cc)) for cc in nx.connected_components(graph)]
-        return ccs
+        n_ccs, labels = csgraph.connected_components(
+            csr_matrix(dist_mat < 1000), directed=False
+        )
+        # bucket indices by label, no python sets per component
+        order = np.argsort(labels, kind="stable")
+        offsets = np.cumsum(np.bincount(labels, minlength=n_ccs))
+        return np.split(order, offsets[:-1])
 
     coordinates = np.array(coordinates, dtype=int)
     coordinates_nm = coordinates * cg.meta.resolution
@@ -2,8 +2,14 @@
 
 import logging
 import os
-import json
-import datetime
+import functools
+
+
+def _build_redis_url(host, port, password):
+    # None instead of "redis://:None@None:6379/0" when host is not configured
+    if host is None:
+        return None
+    return f"redis://:{password}@{host}:{port}/0"
 
 
 class BaseConfig(object):
@@ -17,33 +23,43 @@ class BaseConfig(object):
     CHUNKGRAPH_INSTANCE_ID = "pychunkedgraph"
     PROJECT_ID = os.environ.get("PROJECT_ID", None)
     CG_READ_ONLY = os.environ.get("CG_READ_ONLY", None) is not None
-    PCG_GRAPH_IDS = os.environ.get("PCG_GRAPH_IDS", "").split(",")
+    PCG_GRAPH_IDS = frozenset(
+        x for x in os.environ.get("PCG_GRAPH_IDS", "").split(",") if x
+    )
 
     USE_REDIS_JOBS = False
 
     daf_credential_path = os.environ.get("DAF_CREDENTIALS", None)
 
+    # loaded on first use, see `auth_token` and `virtual_tables`
+    # values set in config.cfg take precedence
     AUTH_TOKEN = None
-    if daf_credential_path is not None:
-        with open(daf_credential_path, "r") as f:
-            AUTH_TOKEN = json.load(f)["token"]
-
     AUTH_SERVICE_NAMESPACE = "pychunkedgraph"
-    VIRTUAL_TABLES = {
-        "minnie65_public_v117": {
-            "table_id": "minnie3_v1",
-            "timestamp": datetime.datetime(
-                year=2021,
-                month=6,
-                day=11,
-                hour=8,
-                minute=10,
-                second=0,
-                microsecond=253,
-                tzinfo=datetime.timezone.utc,
-            ),
+    VIRTUAL_TABLES = None
+
+    @classmethod
+    @functools.cache
+    def auth_token(cls):
+        import json
+
+        if cls.daf_credential_path is None:
+            return None
+        with open(cls.daf_credential_path, "r") as f:
+            return json.load(f)["token"]
+
+    @classmethod
+    @functools.cache
+    def virtual_tables(cls):
+        import datetime
+
+        return {
+            "minnie65_public_v117": {
+                "table_id": "minnie3_v1",
+                "timestamp": datetime.datetime.fromisoformat(
+                    "2021-06-11T08:10:00.000253+00:00"
+                ),
+            }
         }
-    }
 
 
 class DevelopmentConfig(BaseConfig):
@@ -61,7 +77,7 @@ class DockerDevelopmentConfig(DevelopmentConfig):
     REDIS_HOST = os.environ.get("REDIS_HOST", "localhost")
     REDIS_PORT = os.environ.get("REDIS_PORT", "6379")
     REDIS_PASSWORD = os.environ.get("REDIS_PASSWORD", "dev")
-    REDIS_URL = f"redis://:{REDIS_PASSWORD}@{REDIS_HOST}:{REDIS_PORT}/0"
+    REDIS_URL = _build_redis_url(REDIS_HOST, REDIS_PORT, REDIS_PASSWORD)
 
 
 class DeploymentWithRedisConfig(BaseConfig):
@@ -71,7 +87,7 @@ class DeploymentWithRedisConfig(BaseConfig):
     REDIS_HOST = os.environ.get("REDIS_HOST")
     REDIS_PORT = os.environ.get("REDIS_PORT", "6379")
     REDIS_PASSWORD = os.environ.get("REDIS_PASSWORD")
-    REDIS_URL = f"redis://:{REDIS_PASSWORD}@{REDIS_HOST}:{REDIS_PORT}/0"
+    REDIS_URL = _build_redis_url(REDIS_HOST, REDIS_PORT, REDIS_PASSWORD)
 
 
 class TestingConfig(BaseConfig):
@@ -4,7 +4,6 @@ import json
 import os
 import time
 from datetime import datetime
-from functools import reduce
 
 import numpy as np
 import pandas as pd
@@ -18,14 +17,12 @@ from pychunkedgraph.graph import (
     cutting,
     segmenthistory,
 )
-from pychunkedgraph.graph import (
-    edges as cg_edges,
-)
 from pychunkedgraph.graph import (
     exceptions as cg_exceptions,
 )
 from pychunkedgraph.graph.analysis import pathing
 from pychunkedgraph.graph.attributes import OperationLogs
+from pychunkedgraph.graph.edges.utils import concatenate_edges
 from pychunkedgraph.graph.misc import get_contact_sites
 from pychunkedgraph.graph.operation import GraphEditOperation
 from pychunkedgraph.graph.utils import basetypes
@@ -512,7 +509,7 @@ def all_user_operations(
 
     valid_entry_ids = []
     timestamp_list = []
-    undone_ids = np.array([])
+    undone_ids = set()
 
     entry_ids = np.sort(list(log_rows.keys()))
     for entry_id in entry_ids:
@@ -544,12 +541,12 @@ def all_user_operations(
             # if it is an undo of another operation, mark it as undone
             if OperationLogs.UndoOperationID in entry:
                 undone_id = entry[OperationLogs.UndoOperationID]
-                undone_ids = np.append(undone_ids, undone_id)
+                undone_ids.add(int(undone_id))
 
             # if it is a redo of another operation, unmark it as undone
             if OperationLogs.RedoOperationID in entry:
                 redone_id = entry[OperationLogs.RedoOperationID]
-                undone_ids = np.delete(undone_ids, np.argwhere(undone_ids == redone_id))
+                undone_ids.discard(int(redone_id))
 
     if include_undone:
         return {"operation_id": valid_entry_ids, "timestamp": timestamp_list}
@@ -566,7 +563,7 @@ def all_user_operations(
         ):
             continue
 
-        undone = entry_id in undone_ids
+        undone = int(entry_id) in undone_ids
         if not undone:
             filtered_entry_ids.append(entry_id)
             timestamp = entry["timestamp"]
@@ -687,7 +684,7 @@ def handle_subgraph(table_id, root_id):
         bbox=bounding_box,
         bbox_is_coordinate=True,
     )
-    edges = reduce(lambda x, y: x + y, edges, cg_edges.Edges([], []))
+    edges = concatenate_edges(edges)
     supervoxels = np.concatenate(
         [agg.supervoxels for agg in l2id_agglomeration_d.values()]
     )
@@ -789,7 +786,7 @@ def tabular_change_logs(table_id, root_ids, filtered=False):
         return tab
 
     user_name_dict, user_aff_dict = app_utils.get_userinfo_dict(
-        all_user_ids, current_app.config["AUTH_TOKEN"]
+        all_user_ids, app_utils.get_auth_token()
     )
 
     for tab_k in tab.keys():
@@ -1001,8 +998,9 @@ def handle_find_path(table_id, precision_mode):
         cg, coords, node_ids
     )
 
-    source_l2_id = cg.get_parent(source_supervoxel_id)
-    target_l2_id = cg.get_parent(target_supervoxel_id)
+    source_l2_id, target_l2_id = cg.get_parents(
+        np.array([source_supervoxel_id, target_supervoxel_id], dtype=basetypes.NODE_ID)
+    )
 
     print("Finding path...")
     print(f"Source: {source_supervoxel_id}")
@@ -264,7 +264,7 @@ def handle_l2_chunk_children(table_id, chunk_id):
     if as_array:
         resp = {"l2_chunk_children": l2_chunk_children}
     else:
-        resp = {"l2_chunk_children": pickle.dumps(l2_chunk_children)}
+        resp = {"l2_chunk_children": pickle.dumps(l2_chunk_children, protocol=5)}
     return jsonify_with_kwargs(resp, int64_as_str=int64_as_str)
 
 
@@ -280,7 +280,8 @@ def handle_l2_chunk_children_binary(table_id, chunk_id):
     if as_array:
         return tobinary(l2_chunk_children)
     else:
-        return pickle.dumps(l2_chunk_children)
+        # protocol 5 pickles arrays from their buffers without a `tobytes` copy
+        return pickle.dumps(l2_chunk_children, protocol=5)
 
 
 ### LEAVES ---------------------------------------------------------------------
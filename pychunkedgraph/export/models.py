@@ -1,82 +1,193 @@
+from sys import intern
+from typing import Dict
+from typing import List
 from typing import Iterable
+from dataclasses import fields
+from enum import IntEnum
 from dataclasses import dataclass
 from datetime import datetime
+from datetime import timezone
+from datetime import timedelta
 
+import numpy as np
 
-@dataclass
+from ..graph.utils.basetypes import NODE_ID
+from ..graph.utils.basetypes import COORDINATES
+from ..graph.attributes import OperationLogs
+
+# frozen instances are set up in `__post_init__` with this
+_setattr = object.__setattr__
+EPOCH = datetime.fromtimestamp(0, tz=timezone.utc)
+
+
+def to_microseconds(ts: datetime) -> int:
+    """Microseconds since epoch, naive timestamps are assumed to be UTC."""
+    if not isinstance(ts, datetime):
+        return ts
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return (ts - EPOCH) // timedelta(microseconds=1)
+
+
+def from_microseconds(ts: int) -> datetime:
+    if ts is None:
+        return ts
+    return EPOCH + timedelta(microseconds=ts)
+
+
+# int enum members are singletons and still compare equal to stored int values
+LogStatus = IntEnum(
+    "LogStatus", [(s.name, s.value) for s in OperationLogs.StatusCodes]
+)
+
+
+# fields stored as arrays, (dtype, shape)
+ARRAY_FIELDS = {
+    "roots": (NODE_ID, (-1,)),
+    "source_coords": (COORDINATES, (-1, 3)),
+    "sink_coords": (COORDINATES, (-1, 3)),
+    "added_edges": (NODE_ID, (-1, 2)),
+    "removed_edges": (NODE_ID, (-1, 2)),
+    "source_ids": (NODE_ID, (-1,)),
+    "sink_ids": (NODE_ID, (-1,)),
+    "bb_offset": (COORDINATES, (-1,)),
+}
+
+
+@dataclass(slots=True, frozen=True, repr=False, eq=False)
 class OperationLogBase:
     """
     Base class for log format.
+    Slotted to keep per instance memory low, export holds all logs in memory.
+    Frozen, use `dataclasses.replace` to update a log.
+    `timestamp` and `operation_ts` are stored as int microseconds since epoch,
+    IDs, edges and coordinates are stored as numpy arrays, see `ARRAY_FIELDS`.
+    `to_dict` converts them back to datetime and lists.
     """
 
     id: str
     user: str
-    timestamp: datetime
-    status: int
-    roots: Iterable
-    source_coords: Iterable
-    sink_coords: Iterable
-    old_roots: Iterable
-    old_roots_ts: Iterable
-    exception: str
-    operation_ts: datetime
-
-    def __init__(self, **kwargs):
-        self.id = kwargs.get("id")
-        self.user = kwargs.get("user")
-        self.timestamp = kwargs.get("timestamp")
-        self.status = kwargs.get("status")
-        self.roots = kwargs.get("roots")
-        self.source_coords = kwargs.get("source_coords")
-        self.sink_coords = kwargs.get("sink_coords")
-        self.old_roots = kwargs.get("old_roots")
-        self.old_roots_ts = kwargs.get("old_roots_ts")
-        self.exception = kwargs.get("operation_exception")
+    timestamp: int
+    status: LogStatus
+    roots: np.ndarray = None
+    source_coords: np.ndarray = None
+    sink_coords: np.ndarray = None
+    old_roots: Iterable = None
+    old_roots_ts: Iterable = None
+    exception: str = None
+    operation_ts: int = None
+
+    def __post_init__(self):
+        _setattr(self, "status", LogStatus(self.status))
+        if self.user:
+            # few distinct users across many logs, share one string per user
+            _setattr(self, "user", intern(self.user))
+        _setattr(self, "timestamp", to_microseconds(self.timestamp))
+        _setattr(self, "operation_ts", to_microseconds(self.operation_ts))
+        for k, dtype, shape in self._array_fields:
+            val = getattr(self, k)
+            if val is not None:
+                _setattr(self, k, np.asarray(val, dtype=dtype).reshape(shape))
         # this was added recently
         # for older logs assume log_timestamp = operation_timestamp
-        self.operation_ts = kwargs.get("operation_ts", self.timestamp)
-
-
-class OperationLog:
-    """
-    Wrapper class for log format.
-    """
-
-    def __new__(cls, **kwargs):
-        if "added_edges" in kwargs:
-            return MergeLog(**kwargs)
-        return SplitLog(**kwargs)
-
-
-@dataclass
+        if self.operation_ts is None:
+            _setattr(self, "operation_ts", self.timestamp)
+
+    def __repr__(self):
+        return f"{type(self).__name__}(id={self.id}, status={self.status})"
+
+    def to_dict(self) -> Dict:
+        """
+        Shallow alternative to `dataclasses.asdict`,
+        field values are not copied, export only reads them.
+        """
+        result = {k: getattr(self, k) for k in self._field_names}
+        result["status"] = int(self.status)
+        result["timestamp"] = from_microseconds(self.timestamp)
+        result["operation_ts"] = from_microseconds(self.operation_ts)
+        for k, *_ in self._array_fields:
+            if result[k] is not None:
+                result[k] = result[k].tolist()
+        return result
+
+
+@dataclass(slots=True, frozen=True, kw_only=True, repr=False, eq=False)
 class MergeLog(OperationLogBase):
     """Log class for merge operation."""
 
-    added_edges: Iterable
-
-    def __init__(self, **kwargs):
-        added_edges = kwargs.pop("added_edges")
-        super().__init__(**kwargs)
-        self.added_edges = added_edges
-
-
-@dataclass
+    added_edges: np.ndarray
+
+    @classmethod
+    def from_row(cls, row: Dict) -> "MergeLog":
+        """Positional construction, avoids building a kwargs dict per row."""
+        return cls(
+            row["id"],
+            row["user"],
+            row["timestamp"],
+            row["status"],
+            row.get("roots"),
+            row.get("source_coords"),
+            row.get("sink_coords"),
+            row.get("old_roots"),
+            row.get("old_roots_ts"),
+            row.get("exception"),
+            row.get("operation_ts"),
+            added_edges=row["added_edges"],
+        )
+
+
+@dataclass(slots=True, frozen=True, kw_only=True, repr=False, eq=False)
 class SplitLog(OperationLogBase):
     """Log class for split operation."""
 
-    source_ids: Iterable
-    sink_ids: Iterable
-    bb_offset: Iterable
-    removed_edges: Iterable
-
-    def __init__(self, **kwargs):
-        source_ids = kwargs.pop("source_ids")
-        sink_ids = kwargs.pop("sink_ids")
-        bb_offset = kwargs.pop("bb_offset")
-        removed_edges = kwargs.pop("removed_edges", [])
-        super().__init__(**kwargs)
-        self.source_ids = source_ids
-        self.sink_ids = sink_ids
-        self.bb_offset = bb_offset
-        self.removed_edges = removed_edges
-
+    source_ids: np.ndarray
+    sink_ids: np.ndarray
+    bb_offset: np.ndarray
+    removed_edges: np.ndarray = ()
+
+    @classmethod
+    def from_row(cls, row: Dict) -> "SplitLog":
+        """Positional construction, avoids building a kwargs dict per row."""
+        return cls(
+            row["id"],
+            row["user"],
+            row["timestamp"],
+            row["status"],
+            row.get("roots"),
+            row.get("source_coords"),
+            row.get("sink_coords"),
+            row.get("old_roots"),
+            row.get("old_roots_ts"),
+            row.get("exception"),
+            row.get("operation_ts"),
+            source_ids=row["source_ids"],
+            sink_ids=row["sink_ids"],
+            bb_offset=row["bb_offset"],
+            removed_edges=row.get("removed_edges", ()),
+        )
+
+
+# field names are cached per class, `dataclasses.fields` is slow to call per log
+for _cls in (OperationLogBase, MergeLog, SplitLog):
+    _cls._field_names = tuple(f.name for f in fields(_cls))
+    _cls._array_fields = tuple(
+        (k, *ARRAY_FIELDS[k]) for k in _cls._field_names if k in ARRAY_FIELDS
+    )
+del _cls
+
+
+def build_operation_log(row: Dict) -> OperationLogBase:
+    """Build a merge or split log from a parsed log row."""
+    if "added_edges" in row:
+        return MergeLog.from_row(row)
+    return SplitLog.from_row(row)
+
+
+def build_operation_logs(rows: Iterable[Dict]) -> List[OperationLogBase]:
+    """
+    Build logs from parsed log rows, in the order of the rows.
+    """
+    return [
+        MergeLog.from_row(row) if "added_edges" in row else SplitLog.from_row(row)
+        for row in rows
+    ]
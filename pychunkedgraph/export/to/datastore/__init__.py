@@ -6,27 +6,28 @@ from datetime import datetime
 from google.cloud import datastore
 
 from .config import OperationLogsConfig
-from ...models import OperationLog
+from ...models import LogStatus
+from ...models import OperationLogBase
 from ....graph import ChunkedGraph
 from ....utils.general import chunked
 
 
-def _create_col_for_each_root(parsed_logs: Iterable[OperationLog]) -> Iterable[Dict]:
+def _create_col_for_each_root(
+    parsed_logs: Iterable[OperationLogBase],
+) -> Iterable[Dict]:
     """
     Creates a new column for each old and new roots of an operation.
     This makes querying easier. For eg, a split operation yields 2 new roots:
     old_roots = [123] -> old_root1_col = 123
     new_roots = [124,125] -> new_root1_col = 124, new_root2_col = 125
     """
-    from dataclasses import asdict
-
     count = 0
 
     result = []
     for log in parsed_logs:
-        if log.status == 4:
+        if log.status == LogStatus.WRITE_FAILED:
             count += 1
-        log_d = asdict(log)
+        log_d = log.to_dict()
         roots = log_d.pop("roots")
         old_roots = log_d.pop("old_roots")
         old_roots_ts = log_d.pop("old_roots_ts")
@@ -109,7 +110,7 @@ def _write_removed_edges(path: str, removed_edges: Iterable) -> None:
     """
     if not len(removed_edges):
         return
-    from json import dumps
+    from orjson import dumps
     from cloudfiles import CloudFiles
 
     cf = CloudFiles(path)
@@ -178,7 +179,7 @@ def export_operation_logs(
         removed_edges = []
         for log in chunk:
             kind = cg.graph_id
-            if log["status"] == 4:
+            if log["status"] == LogStatus.WRITE_FAILED:
                 kind = f"{cg.graph_id}_failed"
                 failed_count += 1
             op_id = log.pop("id")
@@ -32,14 +32,15 @@ def get_first_shared_parent(
             return cur_first_node_parent
         if cur_second_node_parent in first_node_parent_ids:
             return cur_second_node_parent
-        if cur_first_node_parent is not None:
-            cur_first_node_parent = cg.get_parent(
-                cur_first_node_parent, time_stamp=time_stamp
-            )
-        if cur_second_node_parent is not None:
-            cur_second_node_parent = cg.get_parent(
-                cur_second_node_parent, time_stamp=time_stamp
-            )
+        # parents of both nodes in one read, 0 when there is no parent
+        node_ids = [cur_first_node_parent, cur_second_node_parent]
+        node_ids = np.array([x for x in node_ids if x is not None], dtype=np.uint64)
+        parents = cg.get_parents(
+            node_ids, raw_only=True, fail_to_zero=True, time_stamp=time_stamp
+        )
+        parents_d = dict(zip(node_ids, parents))
+        cur_first_node_parent = parents_d.get(cur_first_node_parent) or None
+        cur_second_node_parent = parents_d.get(cur_second_node_parent) or None
     return None
 
 
@@ -3,8 +3,12 @@
 import time
 import typing
 import datetime
+from threading import Lock
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
+from cachetools import LRUCache
 from pychunkedgraph import __version__
 
 from . import types
@@ -25,6 +29,10 @@ from .edges import utils as edge_utils
 from .chunks import utils as chunk_utils
 from .chunks import hierarchy as chunk_hierarchy
 
+# `get_roots` reads the next layer early only when mapping parents back to
+# this many IDs takes long enough to overlap with a read
+_PREFETCH_MIN_IDS = 10000
+
 
 class ChunkedGraph:
     def __init__(
@@ -61,6 +69,12 @@ class ChunkedGraph:
         self._cache_service = None
         self.mock_edges = None  # hack for unit tests
 
+        # see `_get_bounding_chunk_ids`, size in bytes
+        self._bounding_chunk_ids_cache = LRUCache(
+            maxsize=128 * 1024 * 1024, getsizeof=lambda ids: ids.nbytes
+        )
+        self._bounding_chunk_ids_lock = Lock()
+
     @property
     def meta(self) -> ChunkedGraphMeta:
         return self._meta
@@ -139,7 +153,7 @@ class ChunkedGraph:
             return parent_id
         return id_helpers.get_atomic_id_from_coord(
             self.meta,
-            self.get_root,
+            self.get_roots,
             x,
             y,
             z,
@@ -200,28 +214,28 @@ class ChunkedGraph:
             if not parent_rows:
                 return types.empty_1d
 
-            parents = []
             if current:
-                for id_ in node_ids:
-                    try:
-                        parents.append(parent_rows[id_][0].value)
-                    except KeyError as exc:
-                        if fail_to_zero:
-                            parents.append(0)
-                        else:
-                            raise KeyError from exc
-                parents = np.array(parents, dtype=basetypes.NODE_ID)
-            else:
-                for id_ in node_ids:
-                    try:
-                        parents.append(
-                            [(p.value, p.timestamp) for p in parent_rows[id_]]
-                        )
-                    except KeyError as exc:
-                        if fail_to_zero:
-                            parents.append([(0, datetime.datetime.fromtimestamp(0))])
-                        else:
-                            raise KeyError from exc
+                # missing parents are left as 0 when `fail_to_zero`
+                parents = np.zeros(len(node_ids), dtype=basetypes.NODE_ID)
+                try:
+                    parents[:] = [parent_rows[id_][0].value for id_ in node_ids]
+                except KeyError as exc:
+                    if not fail_to_zero:
+                        raise KeyError from exc
+                    for i, id_ in enumerate(node_ids):
+                        if id_ in parent_rows:
+                            parents[i] = parent_rows[id_][0].value
+                return parents
+
+            parents = []
+            for id_ in node_ids:
+                try:
+                    parents.append([(p.value, p.timestamp) for p in parent_rows[id_]])
+                except KeyError as exc:
+                    if fail_to_zero:
+                        parents.append([(0, datetime.datetime.fromtimestamp(0))])
+                    else:
+                        raise KeyError from exc
             return parents
         return self.cache.parents_multiple(node_ids, time_stamp=time_stamp)
 
@@ -268,6 +282,15 @@ class ChunkedGraph:
                     return types.empty_1d.copy()
                 return children[0].value
             return self.cache.children(node_id_or_ids)
+        if flatten and (raw_only or not self.cache):
+            # concatenate children as read, without building
+            # the {node_id: children} dict and empty arrays for missing nodes
+            node_children_d = self.client.read_nodes(
+                node_ids=node_id_or_ids, properties=attributes.Hierarchy.Child
+            )
+            return np.concatenate(
+                [types.empty_1d, *(v[0].value for v in node_children_d.values())]
+            )
         node_children_d = self._get_children_multiple(node_id_or_ids, raw_only=raw_only)
         if flatten:
             if not node_children_d:
@@ -282,10 +305,11 @@ class ChunkedGraph:
             node_children_d = self.client.read_nodes(
                 node_ids=node_ids, properties=attributes.Hierarchy.Child
             )
+            # nodes without children share one empty array, nothing can be
+            # written to a size 0 array so there is no need to copy it per node
+            empty = types.empty_1d
             return {
-                x: node_children_d[x][0].value
-                if x in node_children_d
-                else types.empty_1d.copy()
+                x: node_children_d[x][0].value if x in node_children_d else empty
                 for x in node_ids
             }
         return self.cache.children_multiple(node_ids)
@@ -302,11 +326,12 @@ class ChunkedGraph:
                     for l in range(2, max(3, self.meta.layer_count))
                 ],
             )
+            # deserialized arrays are read-only views, callers that mutate must copy
             result = {}
             for id_ in l2_ids:
                 try:
                     result[id_] = {
-                        prop.index: val[0].value.copy()
+                        prop.index: val[0].value
                         for prop, val in node_edges_d_d[id_].items()
                     }
                 except KeyError:
@@ -340,40 +365,83 @@ class ChunkedGraph:
         l2_edges_d_d = self.get_atomic_cross_edges(
             np.concatenate(list(node_l2ids_d.values()))
         )
-        for node_id in node_ids:
-            l2_edges_ds = [l2_edges_d_d[l2_id] for l2_id in node_l2ids_d[node_id]]
-            if all_layers:
+        if all_layers:
+            for node_id in node_ids:
+                l2_edges_ds = [l2_edges_d_d[l2_id] for l2_id in node_l2ids_d[node_id]]
                 result[node_id] = edge_utils.concatenate_cross_edge_dicts(l2_edges_ds)
-            else:
-                result[node_id] = self._get_min_layer_cross_edges(
-                    node_id, l2_edges_ds, uplift=uplift
-                )
+            return result
+
+        min_layers, node_edges = self._get_min_layer_cross_edges_multiple(
+            node_ids, layers_, node_l2ids_d, l2_edges_d_d
+        )
+        for i, node_id in enumerate(node_ids):
+            result[node_id] = self._get_min_layer_cross_edges(
+                node_id, int(min_layers[i]), node_edges[i], uplift=uplift
+            )
         return result
 
+    def _get_min_layer_cross_edges_multiple(
+        self,
+        node_ids: np.ndarray,
+        node_layers: np.ndarray,
+        node_l2ids_d: typing.Dict,
+        l2_edges_d_d: typing.Dict,
+    ) -> typing.Tuple[np.ndarray, typing.List[np.ndarray]]:
+        """
+        Returns the first layer >= node layer with cross edges for each node
+        and atomic cross edges of its level 2 descendants at that layer.
+        Edges of all nodes are collected into one array, each row labeled with
+        its layer and node index, so layers are compared with array operations.
+        """
+        edges, counts, edge_layers, owners = [types.empty_2d], [], [], []
+        for i, node_id in enumerate(node_ids):
+            for l2_id in node_l2ids_d[node_id]:
+                for layer, layer_edges in l2_edges_d_d[l2_id].items():
+                    edges.append(layer_edges)
+                    counts.append(len(layer_edges))
+                    edge_layers.append(layer)
+                    owners.append(i)
+        edges = np.concatenate(edges)
+        edge_layers = np.repeat(np.array(edge_layers, dtype=int), counts)
+        owners = np.repeat(np.array(owners, dtype=int), counts)
+
+        min_layers = np.full(len(node_ids), self.meta.layer_count, dtype=int)
+        mask = edge_layers >= node_layers[owners]
+        np.minimum.at(min_layers, owners[mask], edge_layers[mask])
+
+        mask = edge_layers == min_layers[owners]
+        edges, owners = edges[mask], owners[mask]
+        order = np.argsort(owners, kind="stable")
+        counts = np.bincount(owners, minlength=len(node_ids))
+        return min_layers, np.split(edges[order], np.cumsum(counts)[:-1])
+
     def _get_min_layer_cross_edges(
         self,
         node_id: basetypes.NODE_ID,
-        l2id_atomic_cross_edges_ds: typing.Iterable,
+        min_layer: int,
+        edges: np.ndarray,
         uplift=True,
     ) -> typing.Dict[int, typing.Iterable]:
         """
-        Find edges at relevant min_layer >= node_layer.
-        `l2id_atomic_cross_edges_ds` is a list of atomic cross edges of
-        level 2 IDs that are descendants of `node_id`.
+        Cross edges of `node_id` at relevant `min_layer` >= node_layer.
+        `edges` are atomic cross edges of level 2 IDs
+        that are descendants of `node_id` at `min_layer`.
         """
-        min_layer, edges = edge_utils.filter_min_layer_cross_edges_multiple(
-            self.meta, l2id_atomic_cross_edges_ds, self.get_chunk_layer(node_id)
-        )
-        if self.get_chunk_layer(node_id) < min_layer:
+        node_layer = self.get_chunk_layer(node_id)
+        if node_layer < min_layer:
             # cross edges irrelevant
-            return {self.get_chunk_layer(node_id): types.empty_2d}
+            return {node_layer: types.empty_2d}
         if not uplift:
             return {min_layer: edges}
-        node_root_id = node_id
+        if not edges.size:
+            return {min_layer: types.empty_2d}
         node_root_id = self.get_root(node_id, stop_layer=min_layer, ceil=False)
-        edges[:, 0] = node_root_id
-        edges[:, 1] = self.get_roots(edges[:, 1], stop_layer=min_layer, ceil=False)
-        return {min_layer: np.unique(edges, axis=0) if edges.size else types.empty_2d}
+        # all edges start at `node_root_id`, unique rows are unique targets
+        targets = np.unique(
+            self.get_roots(edges[:, 1], stop_layer=min_layer, ceil=False)
+        )
+        sources = np.full(targets.size, node_root_id, dtype=basetypes.NODE_ID)
+        return {min_layer: np.column_stack((sources, targets))}
 
     def get_roots(
         self,
@@ -403,34 +471,65 @@ class ChunkedGraph:
             layer_mask[node_ids == 0] = False
 
             parent_ids = np.array(node_ids, dtype=basetypes.NODE_ID)
-            for _ in range(int(stop_layer + 1)):
-                filtered_ids = parent_ids[layer_mask]
-                unique_ids, inverse = np.unique(filtered_ids, return_inverse=True)
-                temp_ids = self.get_parents(
-                    unique_ids, time_stamp=time_stamp, fail_to_zero=fail_to_zero
-                )
-                if not temp_ids.size:
-                    break
-                else:
-                    temp_ids_i = temp_ids[inverse]
-                    new_layer_mask = layer_mask.copy()
-                    new_layer_mask[new_layer_mask] = (
-                        self.get_chunk_layers(temp_ids_i) < stop_layer
-                    )
-                    if not ceil:
-                        rev_m = self.get_chunk_layers(temp_ids_i) > stop_layer
-                        temp_ids_i[rev_m] = filtered_ids[rev_m]
-
-                    parent_ids[layer_mask] = temp_ids_i
-                    layer_mask = new_layer_mask
-
-                    if np.all(~layer_mask):
-                        if assert_roots:
-                            assert not np.any(
-                                self.get_chunk_layers(parent_ids)
-                                < self.meta.layer_count
-                            ), "roots not found for some IDs"
-                        return parent_ids
+            if not np.any(layer_mask):
+                # all IDs are at or above stop_layer, nothing to read
+                break
+            # IDs are sorted for deduplication only once, later iterations map
+            # to unique parents of the previous iteration with `inverse`
+            unique_ids, inverse = np.unique(parent_ids[layer_mask], return_inverse=True)
+            prefetched = None
+            # next layer is read early by a thread of this call only, the thread
+            # starts with the first submit and leaving the block waits for it
+            prefetch = len(inverse) >= _PREFETCH_MIN_IDS
+            executor = ThreadPoolExecutor(max_workers=1) if prefetch else nullcontext()
+            with executor:
+                for _ in range(int(stop_layer + 1)):
+                    filtered_ids = parent_ids[layer_mask]
+                    if prefetched is not None:
+                        temp_ids = prefetched.result()
+                    else:
+                        temp_ids = self.get_parents(
+                            unique_ids, time_stamp=time_stamp, fail_to_zero=fail_to_zero
+                        )
+                    prefetched = None
+                    if not temp_ids.size:
+                        break
+                    else:
+                        # layers of unique parents, mapped to all IDs with `inverse`
+                        temp_layers = self.get_chunk_layers(temp_ids)
+                        next_mask = temp_layers < stop_layer
+                        # parents not yet at stop_layer are queried next,
+                        # start reading them while the masks below are updated
+                        next_ids = np.unique(temp_ids[next_mask])
+                        if prefetch and next_ids.size:
+                            prefetched = executor.submit(
+                                self.get_parents,
+                                next_ids,
+                                time_stamp=time_stamp,
+                                fail_to_zero=fail_to_zero,
+                            )
+                        temp_ids_i = temp_ids[inverse]
+                        next_mask_i = next_mask[inverse]
+                        new_layer_mask = layer_mask.copy()
+                        new_layer_mask[new_layer_mask] = next_mask_i
+                        if not ceil:
+                            rev_m = temp_layers[inverse] > stop_layer
+                            temp_ids_i[rev_m] = filtered_ids[rev_m]
+
+                        parent_ids[layer_mask] = temp_ids_i
+                        layer_mask = new_layer_mask
+                        unique_ids = next_ids
+                        inverse = np.searchsorted(next_ids, temp_ids)[
+                            inverse[next_mask_i]
+                        ]
+
+                        if np.all(~layer_mask):
+                            if assert_roots:
+                                assert not np.any(
+                                    self.get_chunk_layers(parent_ids)
+                                    < self.meta.layer_count
+                                ), "roots not found for some IDs"
+                            return parent_ids
 
             if not ceil and np.all(
                 self.get_chunk_layers(parent_ids[parent_ids != 0]) >= stop_layer
@@ -466,10 +565,8 @@ class ChunkedGraph:
     ) -> typing.Union[typing.List[np.uint64], np.uint64]:
         """Takes a node id and returns the associated agglomeration ids."""
         time_stamp = misc_utils.get_valid_timestamp(time_stamp)
-        parent_id = node_id
-        all_parent_ids = []
         stop_layer = self.meta.layer_count if not stop_layer else stop_layer
-        if self.get_chunk_layer(parent_id) == stop_layer:
+        if self.get_chunk_layer(node_id) == stop_layer:
             return (
                 np.array([node_id], dtype=basetypes.NODE_ID)
                 if get_all_parents
@@ -477,32 +574,25 @@ class ChunkedGraph:
             )
 
         for _ in range(n_tries):
-            parent_id = node_id
-            for _ in range(self.get_chunk_layer(node_id), int(stop_layer + 1)):
-                temp_parent_id = self.get_parent(parent_id, time_stamp=time_stamp)
-                if temp_parent_id is None:
-                    break
-                else:
-                    parent_id = temp_parent_id
-
-                    if self.get_chunk_layer(parent_id) >= stop_layer:
-                        if self.get_chunk_layer(parent_id) == stop_layer:
-                            all_parent_ids.append(parent_id)
-                        elif ceil:
-                            all_parent_ids.append(parent_id)
-                        break
-                    else:
-                        all_parent_ids.append(parent_id)
-
-            if self.get_chunk_layer(parent_id) >= stop_layer:
-                break
+            parents_d = self.get_all_parents_dict_multiple(
+                [node_id], time_stamp=time_stamp, stop_layer=stop_layer
+            )[node_id]
+            # one parent per layer, sorting by layer gives the path to stop_layer
+            all_parent_ids = [parents_d[layer] for layer in sorted(parents_d)]
+            if all_parent_ids:
+                parent_layer = max(parents_d)
             else:
-                time.sleep(0.5)
+                parent_layer = self.get_chunk_layer(node_id)
+            if parent_layer >= stop_layer:
+                break
+            time.sleep(0.5)
 
-        if self.get_chunk_layer(parent_id) < stop_layer:
+        if parent_layer < stop_layer:
             raise exceptions.ChunkedGraphError(
                 f"Cannot find root id {node_id}, {stop_layer}, {time_stamp}"
             )
+        if not ceil and parent_layer > stop_layer:
+            all_parent_ids = all_parent_ids[:-1]
 
         if get_all_parents:
             return np.array(all_parent_ids, dtype=basetypes.NODE_ID)
@@ -541,10 +631,62 @@ class ChunkedGraph:
         time_stamp: typing.Optional[datetime.datetime] = None,
     ) -> typing.Dict:
         """Takes a node id and returns all parents up to root."""
-        parent_ids = self.get_root(
-            node_id=node_id, time_stamp=time_stamp, get_all_parents=True
+        result = self.get_all_parents_dict_multiple(
+            [node_id], time_stamp=time_stamp, strict=True
         )
-        return dict(zip(self.get_chunk_layers(parent_ids), parent_ids))
+        return result[node_id]
+
+    def get_all_parents_dict_multiple(
+        self,
+        node_ids: typing.Iterable[np.uint64],
+        *,
+        time_stamp: typing.Optional[datetime.datetime] = None,
+        stop_layer: int = None,
+        strict: bool = False,
+    ) -> typing.Dict:
+        """
+        Batch version of `get_all_parents_dict`, returns {node_id: {layer: parent}}.
+        Parents of all nodes are read together, one read per layer,
+        walk stops at the first parent at or above `stop_layer`.
+        With `strict`, raises if a walk ends below `stop_layer`.
+        """
+        time_stamp = misc_utils.get_valid_timestamp(time_stamp)
+        stop_layer = self.meta.layer_count if not stop_layer else stop_layer
+        node_ids = np.array(node_ids, dtype=basetypes.NODE_ID)
+        child_parent_d = {}
+        # layers of parents are extracted once per read, walks below look them up
+        parent_layer_d = {}
+        nodes = np.unique(node_ids[node_ids != 0])
+        layers = self.get_chunk_layers(nodes)
+        while nodes.size:
+            nodes = nodes[layers < stop_layer]
+            if not nodes.size:
+                break
+            parents = self.get_parents(nodes, time_stamp=time_stamp, fail_to_zero=True)
+            if not parents.size:
+                break
+            child_parent_d.update(zip(nodes, parents))
+            nodes = np.unique(parents[parents != 0])
+            layers = self.get_chunk_layers(nodes)
+            parent_layer_d.update(zip(nodes, layers.tolist()))
+
+        result = {}
+        for node_id in node_ids:
+            parents_d = {}
+            parent_id = child_parent_d.get(node_id, 0)
+            while parent_id:
+                parents_d[parent_layer_d[parent_id]] = parent_id
+                parent_id = child_parent_d.get(parent_id, 0)
+            if strict:
+                top_layer = (
+                    max(parents_d) if parents_d else self.get_chunk_layer(node_id)
+                )
+                if top_layer < stop_layer:
+                    raise exceptions.ChunkedGraphError(
+                        f"Cannot find root id {node_id}, {stop_layer}, {time_stamp}"
+                    )
+            result[node_id] = parents_d
+        return result
 
     def get_subgraph(
         self,
@@ -657,7 +799,7 @@ class ChunkedGraph:
         Edges are read from cloud storage.
         """
         from itertools import chain
-        from functools import reduce
+        import fastremap
         from .misc import get_agglomerations
 
         chunk_ids = np.unique(self.get_chunk_ids_from_node_ids(level2_ids))
@@ -669,10 +811,8 @@ class ChunkedGraph:
             edges_d = self.read_chunk_edges(chunk_ids)
 
         fake_edges = self.get_fake_edges(chunk_ids)
-        all_chunk_edges = reduce(
-            lambda x, y: x + y,
-            chain(edges_d.values(), fake_edges.values()),
-            Edges([], []),
+        all_chunk_edges = edge_utils.concatenate_edges(
+            chain(edges_d.values(), fake_edges.values())
         )
 
         if edges_only:
@@ -681,9 +821,12 @@ class ChunkedGraph:
             else:
                 all_chunk_edges = all_chunk_edges.get_pairs()
             supervoxels = self.get_children(level2_ids, flatten=True)
-            mask0 = np.in1d(all_chunk_edges[:, 0], supervoxels)
-            mask1 = np.in1d(all_chunk_edges[:, 1], supervoxels)
-            return all_chunk_edges[mask0 & mask1]
+            # single hash set pass over both columns, IDs not in `supervoxels`
+            # are set to 0, which is never a valid supervoxel ID
+            masked = fastremap.mask_except(
+                all_chunk_edges, supervoxels.tolist(), value=0
+            )
+            return all_chunk_edges[np.all(masked != 0, axis=1)]
 
         l2id_children_d = self.get_children(level2_ids)
         sv_parent_d = {}
@@ -853,68 +996,101 @@ class ChunkedGraph:
         Returns bounding chunk IDs at layers < parent_layer for all chunk IDs.
         Dict[parent_chunk_id] = np.array(bounding_chunk_ids)
         """
+        # `parent_chunk_ids` can have duplicates, avoid redundant calculations
+        parent_chunk_ids = np.array(parent_chunk_ids, dtype=basetypes.NODE_ID)
+        parent_chunk_ids = np.unique(parent_chunk_ids)
+
+        # bounding chunk IDs depend only on the parent chunk
+        # nodes from the same chunks are common across calls, reuse them
+        chunk_id_bchunk_ids_d = {}
+        with self._bounding_chunk_ids_lock:
+            for chunk_id in parent_chunk_ids:
+                ids = self._bounding_chunk_ids_cache.get((chunk_id, unique))
+                if ids is not None:
+                    chunk_id_bchunk_ids_d[chunk_id] = ids
+        if len(chunk_id_bchunk_ids_d) == len(parent_chunk_ids):
+            return chunk_id_bchunk_ids_d
+        parent_chunk_ids = np.array(
+            [c for c in parent_chunk_ids if c not in chunk_id_bchunk_ids_d],
+            dtype=basetypes.NODE_ID,
+        )
+
         parent_chunk_coords = self.get_chunk_coordinates_multiple(parent_chunk_ids)
         parents_layer = self.get_chunk_layer(parent_chunk_ids[0])
-        chunk_id_bchunk_ids_d = {}
-        for i, chunk_id in enumerate(parent_chunk_ids):
-            if chunk_id in chunk_id_bchunk_ids_d:
-                # `parent_chunk_ids` can have duplicates
-                # avoid redundant calculations
-                continue
-            parent_coord = parent_chunk_coords[i]
-            chunk_ids = [types.empty_1d]
-            for child_layer in range(2, parents_layer):
-                bcoords = chunk_utils.get_bounding_children_chunks(
-                    self.meta,
-                    parents_layer,
-                    parent_coord,
-                    child_layer,
-                    return_unique=False,
-                )
-                bchunks_ids = chunk_utils.get_chunk_ids_from_coords(
-                    self.meta, child_layer, bcoords
-                )
-                chunk_ids.append(bchunks_ids)
-            chunk_ids = np.concatenate(chunk_ids)
+        chunk_ids = [[types.empty_1d] for _ in parent_chunk_ids]
+        for child_layer in range(2, parents_layer):
+            bcoords, mask = chunk_utils.get_bounding_children_chunks_multiple(
+                self.meta, parents_layer, parent_chunk_coords, child_layer
+            )
+            bchunks_ids = chunk_utils.get_chunk_ids_from_coords(
+                self.meta, child_layer, bcoords.reshape(-1, 3)
+            ).reshape(mask.shape)
+            for i, ids in enumerate(chunk_ids):
+                ids.append(bchunks_ids[i][mask[i]])
+
+        for chunk_id, ids in zip(parent_chunk_ids, chunk_ids):
+            ids = np.concatenate(ids)
             if unique:
-                chunk_ids = np.unique(chunk_ids)
-            chunk_id_bchunk_ids_d[chunk_id] = chunk_ids
+                ids = np.unique(ids)
+            # shared with later calls through the cache, callers must not modify
+            ids.setflags(write=False)
+            chunk_id_bchunk_ids_d[chunk_id] = ids
+            with self._bounding_chunk_ids_lock:
+                try:
+                    self._bounding_chunk_ids_cache[(chunk_id, unique)] = ids
+                except ValueError:
+                    # larger than the cache
+                    pass
         return chunk_id_bchunk_ids_d
 
     def _get_bounding_l2_children(self, parents: typing.Iterable) -> typing.Dict:
+        from ..utils.general import in2d
+
+        parents = np.array(parents, dtype=basetypes.NODE_ID)
         parent_chunk_ids = self.get_chunk_ids_from_node_ids(parents)
         chunk_id_bchunk_ids_d = self._get_bounding_chunk_ids(
             parent_chunk_ids, unique=len(parents) >= 200
         )
+        # [parent chunk ID, bounding chunk ID] pairs
+        # to filter descendants of all parents at once
+        bchunk_ids = list(chunk_id_bchunk_ids_d.values())
+        bounding_pairs = np.column_stack(
+            [
+                np.repeat(
+                    np.fromiter(chunk_id_bchunk_ids_d.keys(), dtype=basetypes.NODE_ID),
+                    [len(ids) for ids in bchunk_ids],
+                ),
+                np.concatenate(bchunk_ids),
+            ]
+        )
 
-        parent_descendants_d = {
-            _id: np.array([_id], dtype=basetypes.NODE_ID) for _id in parents
-        }
-        descendants_all = np.concatenate(list(parent_descendants_d.values()))
-        descendants_layers = self.get_chunk_layers(descendants_all)
-        layer_mask = descendants_layers > 2
-        descendants_all = descendants_all[layer_mask]
-
-        while descendants_all.size:
-            descendant_children_d = self.get_children(descendants_all)
-            for i, parent_id in enumerate(parents):
-                _descendants = parent_descendants_d[parent_id]
-                _layers = self.get_chunk_layers(_descendants)
-                _l2mask = _layers == 2
-                descendants = [_descendants[_l2mask]]
-                for child in _descendants[~_l2mask]:
-                    descendants.append(descendant_children_d[child])
-                descendants = np.concatenate(descendants)
-                chunk_ids = self.get_chunk_ids_from_node_ids(descendants)
-                bchunk_ids = chunk_id_bchunk_ids_d[parent_chunk_ids[i]]
-                bounding_descendants = descendants[np.in1d(chunk_ids, bchunk_ids)]
-                parent_descendants_d[parent_id] = bounding_descendants
-
-            descendants_all = np.concatenate(list(parent_descendants_d.values()))
-            descendants_layers = self.get_chunk_layers(descendants_all)
-            layer_mask = descendants_layers > 2
-            descendants_all = descendants_all[layer_mask]
-        return parent_descendants_d
+        # descendants of all parents in one array
+        # `owners` has the index of each descendant's parent
+        descendants = parents.copy()
+        owners = np.arange(len(parents))
+        descendants_layers = self.get_chunk_layers(descendants)
+        while np.any(descendants_layers > 2):
+            l2mask = descendants_layers == 2
+            descendant_children_d = self.get_children(np.unique(descendants[~l2mask]))
+            children = [descendant_children_d[id_] for id_ in descendants[~l2mask]]
+            descendants = np.concatenate([descendants[l2mask], *children])
+            owners = np.concatenate(
+                [
+                    owners[l2mask],
+                    np.repeat(owners[~l2mask], [len(ids) for ids in children]),
+                ]
+            )
+            chunk_ids = self.get_chunk_ids_from_node_ids(descendants)
+            pairs = np.column_stack([parent_chunk_ids[owners], chunk_ids])
+            mask = in2d(pairs, bounding_pairs)
+            descendants = descendants[mask]
+            owners = owners[mask]
+            descendants_layers = self.get_chunk_layers(descendants)
+
+        order = np.argsort(owners, kind="stable")
+        counts = np.bincount(owners, minlength=len(parents))
+        descendants = np.split(descendants[order], np.cumsum(counts)[:-1])
+        return dict(zip(parents, descendants))
 
     # HELPERS / WRAPPERS
 
@@ -1002,6 +1178,7 @@ class ChunkedGraph:
         return get_chunk_edges(
             self.meta.data_source.EDGES,
             self.get_chunk_coordinates_multiple(chunk_ids),
+            cache=True,
         )
 
     def get_proofread_root_ids(
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from itertools import product
 from typing import Sequence
 from typing import Iterable
@@ -8,6 +9,14 @@ from . import utils
 from ..meta import ChunkedGraphMeta
 
 
+@lru_cache(maxsize=None)
+def _get_children_offsets(fanout: int) -> np.ndarray:
+    """Offsets of children chunks, in the same order as `product`. Read-only."""
+    offsets = np.array(list(product(range(fanout), repeat=3)), dtype=int)
+    offsets.flags.writeable = False
+    return offsets
+
+
 def get_children_chunk_coords(
     meta: ChunkedGraphMeta, layer: int, chunk_coords: Sequence[int]
 ) -> Iterable:
@@ -18,15 +27,22 @@ def get_children_chunk_coords(
     chunk_coords = np.array(chunk_coords, dtype=int)
     children_layer = layer - 1
     layer_boundaries = meta.layer_chunk_bounds[children_layer]
-    children_coords = []
-
-    for dcoord in product(*[range(meta.graph_config.FANOUT)] * 3):
-        dcoord = np.array(dcoord, dtype=int)
-        child_coords = chunk_coords * meta.graph_config.FANOUT + dcoord
-        check_bounds = np.less(child_coords, layer_boundaries)
-        if np.all(check_bounds):
-            children_coords.append(child_coords)
-    return np.array(children_coords)
+    fanout = meta.graph_config.FANOUT
+    children_coords = chunk_coords * fanout + _get_children_offsets(fanout)
+    return children_coords[np.all(children_coords < layer_boundaries, axis=1)]
+
+
+def get_children_chunk_count(
+    meta: ChunkedGraphMeta, layer: int, chunk_coords: Sequence[int]
+) -> int:
+    """
+    Number of children chunks, same as `len(get_children_chunk_coords(...))`.
+    Counted per dimension without building the coordinates.
+    """
+    fanout = meta.graph_config.FANOUT
+    start = np.array(chunk_coords, dtype=int) * fanout
+    bounds = np.array(meta.layer_chunk_bounds[layer - 1], dtype=int)
+    return int(np.prod(np.clip(bounds - start, 0, fanout)))
 
 
 def get_children_chunk_ids(
@@ -1,6 +1,7 @@
 # pylint: disable=invalid-name, missing-docstring
 
 from typing import List
+from typing import Tuple
 from typing import Union
 from typing import Optional
 from typing import Sequence
@@ -146,7 +147,10 @@ def get_chunk_ids_from_node_ids(meta, ids: Iterable[np.uint64]) -> np.ndarray:
     if len(ids) == 0:
         return np.array([], dtype=np.uint64)
 
-    bits_per_dims = np.array([meta.bitmasks[l] for l in get_chunk_layers(meta, ids)])
+    # bits per layer as a lookup table, avoids a dict lookup per ID
+    bitmasks = np.zeros(max(meta.bitmasks) + 1, dtype=int)
+    bitmasks[list(meta.bitmasks.keys())] = list(meta.bitmasks.values())
+    bits_per_dims = bitmasks[get_chunk_layers(meta, ids)]
     offsets = 64 - meta.graph_config.LAYER_ID_BITS - 3 * bits_per_dims
 
     cids1 = np.array((np.array(ids, dtype=int) >> offsets) << offsets, dtype=np.uint64)
@@ -233,3 +237,27 @@ def get_bounding_children_chunks(
     if return_unique:
         return np.unique(result, axis=0) if result.size else result
     return result
+
+
+def get_bounding_children_chunks_multiple(
+    cg_meta, layer: int, chunks_coords: Sequence[Sequence[int]], children_layer
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Array version of get_bounding_children_chunks, for chunks at the same layer.
+    Boundary offsets are the same for all chunks, so they are computed once.
+    Returns children chunk coordinates of shape (n_chunks, n_children, 3)
+    and a mask of those within layer bounds, duplicates are not removed.
+    """
+    chunks_coords = np.array(chunks_coords, dtype=int).reshape(-1, 3)
+
+    # children chunk count along one dimension
+    chunks_count = cg_meta.graph_config.FANOUT ** (layer - children_layer)
+    r = range(chunks_count)
+    bounds = (0, chunks_count - 1)
+
+    f = lambda r1, r2, r3: np.array(np.meshgrid(r1, r2, r3), dtype=int).T.reshape(-1, 3)
+    offsets = np.concatenate([f(bounds, r, r), f(r, bounds, r), f(r, r, bounds)])
+
+    chunks = chunks_coords[:, None, :] * chunks_count + offsets
+    mask = np.all(chunks < cg_meta.layer_chunk_bounds[children_layer], axis=2)
+    return chunks, mask
@@ -86,6 +86,14 @@ class SimpleClient(ABC):
     def unlock_indefinitely_locked_root(self, node_id, operation_id):
         """Unlocks root node that is indefinitely locked with operation_id."""
 
+    @abstractmethod
+    def unlock_roots(self, node_ids, operation_id):
+        """Unlocks root nodes that are locked with operation_id."""
+
+    @abstractmethod
+    def unlock_indefinitely_locked_roots(self, node_ids, operation_id):
+        """Unlocks root nodes that are indefinitely locked with operation_id."""
+
     @abstractmethod
     def renew_lock(self, node_id, operation_id):
         """Renews existing node lock with operation_id for extended time."""
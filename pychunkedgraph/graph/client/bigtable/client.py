@@ -6,6 +6,7 @@ import typing
 import logging
 import datetime
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 from multiwrapper import multiprocessing_utils as mu
@@ -443,8 +444,7 @@ class Client(bigtable.Client, ClientWithIDGen, OperationLogger):
                 lock_acquired = self.lock_root(root_id, operation_id)
                 # Roll back locks if one root cannot be locked
                 if not lock_acquired:
-                    for id_ in root_ids:
-                        self.unlock_root(id_, operation_id)
+                    self.unlock_roots(root_ids, operation_id)
                     break
 
             if lock_acquired:
@@ -480,8 +480,7 @@ class Client(bigtable.Client, ClientWithIDGen, OperationLogger):
             # Roll back locks if one root cannot be locked
             if not lock_acquired:
                 failed_to_lock_id = _id
-                for id_ in root_ids:
-                    self.unlock_indefinitely_locked_root(id_, operation_id)
+                self.unlock_indefinitely_locked_roots(root_ids, operation_id)
                 break
         if lock_acquired:
             return True, root_ids, failed_to_lock_id
@@ -513,6 +512,36 @@ class Client(bigtable.Client, ClientWithIDGen, OperationLogger):
         root_row.delete_cell(lock_column.family_id, lock_column.key, state=True)
         return root_row.commit()
 
+    def unlock_roots(
+        self, root_ids: typing.Sequence[np.uint64], operation_id: np.uint64
+    ) -> typing.List[bool]:
+        """Unlocks root nodes that are locked with operation_id."""
+        return self._map_roots(self.unlock_root, root_ids, operation_id)
+
+    def unlock_indefinitely_locked_roots(
+        self, root_ids: typing.Sequence[np.uint64], operation_id: np.uint64
+    ) -> typing.List[bool]:
+        """Unlocks root nodes that are indefinitely locked with operation_id."""
+        return self._map_roots(
+            self.unlock_indefinitely_locked_root, root_ids, operation_id
+        )
+
+    def _map_roots(
+        self,
+        func: typing.Callable,
+        root_ids: typing.Sequence[np.uint64],
+        operation_id: np.uint64,
+    ) -> typing.List:
+        """
+        Conditional mutations are one request per row and cannot be batched,
+        so requests for multiple roots are sent concurrently.
+        """
+        root_ids = list(root_ids)
+        if len(root_ids) < 2:
+            return [func(root_id, operation_id) for root_id in root_ids]
+        with ThreadPoolExecutor(max_workers=min(len(root_ids), 16)) as executor:
+            return list(executor.map(lambda id_: func(id_, operation_id), root_ids))
+
     def renew_lock(self, root_id: np.uint64, operation_id: np.uint64) -> bool:
         """Renews existing root node lock with operation_id to extend time."""
         lock_column = attributes.Concurrency.Lock
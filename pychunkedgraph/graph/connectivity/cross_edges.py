@@ -1,7 +1,6 @@
 import time
 import math
 import multiprocessing as mp
-from collections import defaultdict
 from typing import Optional
 from typing import Sequence
 from typing import List
@@ -44,11 +43,10 @@ def get_children_chunk_cross_edges(
 
         task_size = int(math.ceil(len(atomic_chunks) / mp.cpu_count() / 10))
         chunked_l2chunk_list = chunked(atomic_chunks, task_size)
+        cg_info = cg.get_serialized_info()
         multi_args = []
         for atomic_chunks in chunked_l2chunk_list:
-            multi_args.append(
-                (edge_ids_shared, cg.get_serialized_info(), atomic_chunks, layer - 1)
-            )
+            multi_args.append((edge_ids_shared, cg_info, atomic_chunks, layer - 1))
 
         multiprocess_func(
             _get_children_chunk_cross_edges_helper,
@@ -94,20 +92,18 @@ def _read_atomic_chunk_cross_edges(
     cross_edge_col = attributes.Connectivity.CrossChunkEdge[cross_edge_layer]
     range_read, l2ids = _read_atomic_chunk(cg, chunk_coord, [cross_edge_layer])
 
-    parent_neighboring_chunk_supervoxels_d = defaultdict(list)
+    # edges are bucketed as flat arrays, l2ids are repeated once at the end
+    parent_ids = []
+    nebor_svs = [empty_2d[:, 1]]
     for l2id in l2ids:
         if not cross_edge_col in range_read[l2id]:
             continue
-        edges = range_read[l2id][cross_edge_col][0].value
-        parent_neighboring_chunk_supervoxels_d[l2id] = edges[:, 1]
+        parent_ids.append(l2id)
+        nebor_svs.append(range_read[l2id][cross_edge_col][0].value[:, 1])
 
-    cross_edges = [empty_2d]
-    for l2id in parent_neighboring_chunk_supervoxels_d:
-        nebor_svs = parent_neighboring_chunk_supervoxels_d[l2id]
-        chunk_parent_ids = np.array([l2id] * len(nebor_svs), dtype=basetypes.NODE_ID)
-        cross_edges.append(np.vstack([chunk_parent_ids, nebor_svs]).T)
-    cross_edges = np.concatenate(cross_edges)
-    return cross_edges
+    counts = [len(svs) for svs in nebor_svs[1:]]
+    parent_ids = np.repeat(np.array(parent_ids, dtype=basetypes.NODE_ID), counts)
+    return np.column_stack([parent_ids, np.concatenate(nebor_svs)])
 
 
 def get_chunk_nodes_cross_edge_layer(
@@ -172,11 +168,18 @@ def _get_chunk_nodes_cross_edge_layer(cg, atomic_chunks, layer):
     l2ids = np.fromiter(atomic_node_layer_d.keys(), dtype=basetypes.NODE_ID)
     parents = cg.get_roots(l2ids, stop_layer=layer - 1, ceil=False)
     layers = np.fromiter(atomic_node_layer_d.values(), dtype=int)
+    return _get_min_layers(parents, layers)
 
-    node_layer_d = defaultdict(lambda: cg.meta.layer_count)
-    for i, parent in enumerate(parents):
-        node_layer_d[parent] = min(node_layer_d[parent], layers[i])
-    return node_layer_d
+
+def _get_min_layers(node_ids: np.ndarray, layers: np.ndarray) -> Dict:
+    """{node_id: min layer} for repeated node_ids, with one sort."""
+    if not node_ids.size:
+        return {}
+    order = np.lexsort((layers, node_ids))
+    node_ids = node_ids[order]
+    first = np.ones(node_ids.size, dtype=bool)
+    first[1:] = node_ids[1:] != node_ids[:-1]
+    return dict(zip(node_ids[first], layers[order][first].tolist()))
 
 
 def _read_atomic_chunk_cross_edge_nodes(cg, chunk_coord, cross_edge_layers):
@@ -193,9 +196,8 @@ def _read_atomic_chunk_cross_edge_nodes(cg, chunk_coord, cross_edge_layers):
 def _find_min_layer(node_layer_d_shared, ids_l_shared, layers_l_shared):
     node_ids = np.concatenate(ids_l_shared)
     layers = np.concatenate(layers_l_shared)
-    for i, node_id in enumerate(node_ids):
-        layer = node_layer_d_shared.get(node_id, layers[i])
-        node_layer_d_shared[node_id] = min(layer, layers[i])
+    # single update, each access to the shared dict is a round trip to the manager
+    node_layer_d_shared.update(_get_min_layers(node_ids, layers))
 
 
 def _read_atomic_chunk(cg, chunk_coord, layers):
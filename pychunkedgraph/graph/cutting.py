@@ -402,6 +402,20 @@ class LocalMincutGraph:
 
         return remapped_cutset[cutset_mask]
 
+    def _count_team_vertices(self, ccs):
+        """
+        Number of source and sink vertices in each connected component.
+        Vertices are labeled by component once, instead of testing
+        membership of sources and sinks with `np.in1d` per component.
+        """
+        n_vertices = self.weighted_graph.num_vertices(ignore_filter=True)
+        labels = flatgraph.component_labels(ccs, n_vertices)
+        source_counts = np.bincount(
+            labels[self.source_graph_ids], minlength=len(ccs)
+        )
+        sink_counts = np.bincount(labels[self.sink_graph_ids], minlength=len(ccs))
+        return source_counts, sink_counts
+
     def _remap_graph_ids_to_cg_supervoxels(self, graph_ids):
         supervoxel_list = []
         # Supervoxels that were passed into graph
@@ -430,17 +444,16 @@ class LocalMincutGraph:
         max_sources = 0
         max_sink_index = -1
         max_sinks = 0
-        i = 0
-        for cc in ccs_test_post_cut:
-            num_sources = np.count_nonzero(np.in1d(self.source_graph_ids, cc))
-            num_sinks = np.count_nonzero(np.in1d(self.sink_graph_ids, cc))
+        source_counts, sink_counts = self._count_team_vertices(ccs_test_post_cut)
+        for i in range(len(ccs_test_post_cut)):
+            num_sources = source_counts[i]
+            num_sinks = sink_counts[i]
             if num_sources > max_sources:
                 max_sources = num_sources
                 max_source_index = i
             if num_sinks > max_sinks:
                 max_sinks = num_sinks
                 max_sink_index = i
-            i += 1
         supervoxel_ccs[0] = self._remap_graph_ids_to_cg_supervoxels(
             ccs_test_post_cut[max_source_index]
         )
@@ -482,13 +495,11 @@ class LocalMincutGraph:
         removed = self.weighted_graph.new_vertex_property("bool")
         removed.a = False
         if len(ccs) > 1:
-            for cc in ccs:
+            source_counts, sink_counts = self._count_team_vertices(ccs)
+            for i, cc in enumerate(ccs):
                 # If connected component contains no sources or no sinks,
                 # remove its nodes from the mincut computation
-                if not (
-                    np.any(np.in1d(self.source_graph_ids, cc))
-                    and np.any(np.in1d(self.sink_graph_ids, cc))
-                ):
+                if not (source_counts[i] and sink_counts[i]):
                     for node_id in cc:
                         removed[node_id] = True
 
@@ -554,10 +565,13 @@ class LocalMincutGraph:
         # after removing the cut edges and the fake infinity edges
         illegal_split = False
         try:
-            for cc in ccs_test_post_cut:
-                if np.any(np.in1d(self.source_graph_ids, cc)):
-                    assert np.all(np.in1d(self.source_graph_ids, cc))
-                    assert ~np.any(np.in1d(self.sink_graph_ids, cc))
+            n_sources = len(self.source_graph_ids)
+            n_sinks = len(self.sink_graph_ids)
+            source_counts, sink_counts = self._count_team_vertices(ccs_test_post_cut)
+            for i, cc in enumerate(ccs_test_post_cut):
+                if source_counts[i]:
+                    assert source_counts[i] == n_sources
+                    assert sink_counts[i] == 0
                     if (
                         len(self.source_path_vertices) == len(cc)
                         and self.disallow_isolating_cut
@@ -565,9 +579,9 @@ class LocalMincutGraph:
                         if not self.partition_edges_within_label(cc):
                             raise IsolatingCutException("Source")
 
-                if np.any(np.in1d(self.sink_graph_ids, cc)):
-                    assert np.all(np.in1d(self.sink_graph_ids, cc))
-                    assert ~np.any(np.in1d(self.source_graph_ids, cc))
+                if sink_counts[i]:
+                    assert sink_counts[i] == n_sinks
+                    assert source_counts[i] == 0
                     if (
                         len(self.sink_path_vertices) == len(cc)
                         and self.disallow_isolating_cut
@@ -85,6 +85,9 @@ class Edges:
 
     def __getitem__(self, key):
         """`key` must be a boolean numpy array."""
+        if isinstance(key, np.ndarray) and key.dtype == bool:
+            # resolve the mask once for all four arrays
+            key = np.flatnonzero(key)
         try:
             return Edges(
                 self.node_ids1[key],
@@ -20,27 +20,34 @@ from ..chunks import utils as chunk_utils
 from ..meta import ChunkedGraphMeta
 
 
+def concatenate_edges(edges_list: Iterable[Edges]) -> Edges:
+    """
+    Combine multiple Edges instances into one.
+    Each array is concatenated once, unlike adding instances pairwise.
+    """
+    sv_ids1 = [np.array([], dtype=basetypes.NODE_ID)]
+    sv_ids2 = [np.array([], dtype=basetypes.NODE_ID)]
+    affinities = [np.array([], dtype=basetypes.EDGE_AFFINITY)]
+    areas = [np.array([], dtype=basetypes.EDGE_AREA)]
+    for edges in edges_list:
+        sv_ids1.append(edges.node_ids1)
+        sv_ids2.append(edges.node_ids2)
+        affinities.append(edges.affinities)
+        areas.append(edges.areas)
+
+    sv_ids1 = np.concatenate(sv_ids1)
+    sv_ids2 = np.concatenate(sv_ids2)
+    affinities = np.concatenate(affinities)
+    areas = np.concatenate(areas)
+    return Edges(sv_ids1, sv_ids2, affinities=affinities, areas=areas)
+
+
 def concatenate_chunk_edges(chunk_edge_dicts: Iterable) -> Dict:
     """combine edge_dicts of multiple chunks into one edge_dict"""
     edges_dict = {}
     for edge_type in EDGE_TYPES:
-        sv_ids1 = [np.array([], dtype=basetypes.NODE_ID)]
-        sv_ids2 = [np.array([], dtype=basetypes.NODE_ID)]
-        affinities = [np.array([], dtype=basetypes.EDGE_AFFINITY)]
-        areas = [np.array([], dtype=basetypes.EDGE_AREA)]
-        for edge_d in chunk_edge_dicts:
-            edges = edge_d[edge_type]
-            sv_ids1.append(edges.node_ids1)
-            sv_ids2.append(edges.node_ids2)
-            affinities.append(edges.affinities)
-            areas.append(edges.areas)
-
-        sv_ids1 = np.concatenate(sv_ids1)
-        sv_ids2 = np.concatenate(sv_ids2)
-        affinities = np.concatenate(affinities)
-        areas = np.concatenate(areas)
-        edges_dict[edge_type] = Edges(
-            sv_ids1, sv_ids2, affinities=affinities, areas=areas
+        edges_dict[edge_type] = concatenate_edges(
+            edge_d[edge_type] for edge_d in chunk_edge_dicts
         )
     return edges_dict
 
@@ -65,9 +72,8 @@ def merge_cross_edge_dicts(x_edges_d1: Dict, x_edges_d2: Dict) -> Dict:
     Combines two cross chunk dictionaries of form
     {node_id: {layer id : edge list}}.
     """
-    node_ids = np.unique(list(x_edges_d1.keys()) + list(x_edges_d2.keys()))
     result_d = {}
-    for node_id in node_ids:
+    for node_id in x_edges_d1.keys() | x_edges_d2.keys():
         cross_edge_ds = [x_edges_d1.get(node_id, {}), x_edges_d2.get(node_id, {})]
         result_d[node_id] = concatenate_cross_edge_dicts(cross_edge_ds)
     return result_d
@@ -87,8 +93,10 @@ def categorize_edges(
     `cross_edges`
         originating from given supervoxels but crossing chunk boundary
     """
-    mask1 = np.isin(edges.node_ids1, supervoxels)
-    mask2 = np.isin(edges.node_ids2, supervoxels)
+    # hash set membership, avoids sorting supervoxels; 0 is not a valid supervoxel
+    supervoxels = np.asarray(supervoxels, dtype=basetypes.NODE_ID).tolist()
+    mask1 = fastremap.mask_except(edges.node_ids1, supervoxels, in_place=False) != 0
+    mask2 = fastremap.mask_except(edges.node_ids2, supervoxels, in_place=False) != 0
     in_mask = mask1 & mask2
     out_mask = mask1 & ~mask2
 
@@ -140,15 +148,40 @@ def get_cross_chunk_edges_layer(meta: ChunkedGraphMeta, cross_edges: Iterable):
     """
     if len(cross_edges) == 0:
         return np.array([], dtype=int)
-    cross_chunk_edge_layers = np.ones(len(cross_edges), dtype=int)
-    coords0 = chunk_utils.get_chunk_coordinates_multiple(meta, cross_edges[:, 0])
-    coords1 = chunk_utils.get_chunk_coordinates_multiple(meta, cross_edges[:, 1])
+    cross_edges = np.asarray(cross_edges, dtype=basetypes.NODE_ID)
+    coords = chunk_utils.get_chunk_coordinates_multiple(meta, cross_edges.ravel())
+    return _get_cross_chunk_edges_layer(meta, coords.reshape(-1, 2, 3))
 
+
+def _get_cross_chunk_edges_layer(meta: ChunkedGraphMeta, coords: np.ndarray):
+    """
+    Same as `get_cross_chunk_edges_layer`,
+    with chunk coordinates of edges (n x 2 x 3) computed by the caller.
+    """
+    fanout = int(meta.graph_config.FANOUT)
+    shift = fanout.bit_length() - 1
+    if fanout == 1 << shift:
+        # coordinates are equal after `d` shifts by `shift` bits
+        # when the highest differing bit of any dimension is below `d * shift`
+        diff = np.bitwise_or.reduce(coords[:, 0] ^ coords[:, 1], axis=1)
+        _, n_bits = np.frexp(diff)  # bit length, 0 when equal
+        n_shifts = -(-n_bits // shift)
+        return np.minimum(n_shifts + 1, meta.layer_count - 1).astype(int)
+
+    cross_chunk_edge_layers = np.ones(len(coords), dtype=int)
+    coords0 = coords[:, 0]
+    coords1 = coords[:, 1]
+
+    # only edges still spanning different chunks are carried to the next layer
+    edge_idx = np.arange(len(coords))
     for _ in range(2, meta.layer_count):
-        edge_diff = np.sum(np.abs(coords0 - coords1), axis=1)
-        cross_chunk_edge_layers[edge_diff > 0] += 1
-        coords0 = coords0 // meta.graph_config.FANOUT
-        coords1 = coords1 // meta.graph_config.FANOUT
+        mask = np.any(coords0 != coords1, axis=1)
+        edge_idx = edge_idx[mask]
+        if not edge_idx.size:
+            break
+        cross_chunk_edge_layers[edge_idx] += 1
+        coords0 = coords0[mask] // fanout
+        coords1 = coords1[mask] // fanout
     return cross_chunk_edge_layers
 
 
@@ -166,30 +199,11 @@ def filter_min_layer_cross_edges(
     return (meta.layer_count, edges_)
 
 
-def filter_min_layer_cross_edges_multiple(
-    meta: ChunkedGraphMeta, l2id_atomic_cross_edges_ds: Iterable, node_layer: int = 2
-) -> Tuple[int, Iterable]:
-    """
-    Given a list of dicts of cross chunk edges [{layer: edges}]
-    Return the first layer with cross edges.
-    """
-    min_layer = meta.layer_count
-    for edges_d in l2id_atomic_cross_edges_ds:
-        layer_, _ = filter_min_layer_cross_edges(meta, edges_d, node_layer=node_layer)
-        min_layer = min(min_layer, layer_)
-    edges = [empty_2d]
-    for edges_d in l2id_atomic_cross_edges_ds:
-        edges.append(edges_d.get(min_layer, empty_2d))
-    return min_layer, np.concatenate(edges)
-
-
 def get_edges_status(cg, edges: Iterable, time_stamp: Optional[float] = None):
     from ...utils.general import in2d
 
-    coords0 = chunk_utils.get_chunk_coordinates_multiple(cg.meta, edges[:, 0])
-    coords1 = chunk_utils.get_chunk_coordinates_multiple(cg.meta, edges[:, 1])
-
-    coords = np.concatenate([np.array(coords0), np.array(coords1)])
+    # coordinates are computed once, for both the bbox and edge layers
+    coords = chunk_utils.get_chunk_coordinates_multiple(cg.meta, edges.ravel())
     bbox = [np.min(coords, axis=0), np.max(coords, axis=0)]
     bbox[1] += 1
 
@@ -203,14 +217,13 @@ def get_edges_status(cg, edges: Iterable, time_stamp: Optional[float] = None):
         edges_only=True,
     )
     existence_status = in2d(edges, sg_edges)
-    edge_layers = cg.get_cross_chunk_edges_layer(edges)
-    active_status = []
+    edge_layers = _get_cross_chunk_edges_layer(cg.meta, coords.reshape(-1, 2, 3))
+    # status is filled in place, aligned with `edges`
+    active_status = np.zeros(len(edges), dtype=bool)
     for layer in np.unique(edge_layers):
-        layer_edges = edges[edge_layers == layer]
+        layer_mask = edge_layers == layer
         edges_parents = cg.get_roots(
-            layer_edges.ravel(), time_stamp=time_stamp, stop_layer=layer + 1
+            edges[layer_mask].ravel(), time_stamp=time_stamp, stop_layer=layer + 1
         ).reshape(-1, 2)
-        mask = edges_parents[:, 0] == edges_parents[:, 1]
-        active_status.extend(mask)
-    active_status = np.array(active_status, dtype=bool)
+        active_status[layer_mask] = edges_parents[:, 0] == edges_parents[:, 1]
     return existence_status, active_status
@@ -20,14 +20,18 @@ from .utils import flatgraph
 from .utils.serializers import serialize_uint64
 from ..logging.log_db import TimeIt
 from ..utils.general import in2d
+from ..utils.general import unique_rows
 
 
 def _init_old_hierarchy(cg, l2ids: np.ndarray, parent_ts: datetime.datetime = None):
     new_old_id_d = defaultdict(set)
     old_new_id_d = defaultdict(set)
     old_hierarchy_d = {id_: {2: id_} for id_ in l2ids}
+    all_parents_d = cg.get_all_parents_dict_multiple(
+        l2ids, time_stamp=parent_ts, strict=True
+    )
     for id_ in l2ids:
-        layer_parent_d = cg.get_all_parents_dict(id_, time_stamp=parent_ts)
+        layer_parent_d = all_parents_d[id_]
         old_hierarchy_d[id_].update(layer_parent_d)
         for parent in layer_parent_d.values():
             old_hierarchy_d[parent] = old_hierarchy_d[id_]
@@ -70,13 +74,12 @@ def _get_relevant_components(edges: np.ndarray, supervoxels: np.ndarray) -> Tupl
     edges = np.concatenate([edges, np.vstack([supervoxels, supervoxels]).T])
     graph, _, _, graph_ids = flatgraph.build_gt_graph(edges, make_directed=True)
     ccs = flatgraph.connected_components(graph)
-    relevant_ccs = []
+    labels = flatgraph.component_labels(ccs, len(graph_ids))
+    # graph_ids are sorted, components containing supervoxels in one lookup
+    relevant = np.unique(labels[np.searchsorted(graph_ids, supervoxels)])
     # remove if connected component contains no sources or no sinks
     # when merging, there must be only two components
-    for cc_idx in ccs:
-        cc = graph_ids[cc_idx]
-        if np.any(np.in1d(supervoxels, cc)):
-            relevant_ccs.append(cc)
+    relevant_ccs = [graph_ids[ccs[i]] for i in relevant]
     assert len(relevant_ccs) == 2, "must be 2 components"
     return relevant_ccs
 
@@ -121,7 +124,7 @@ def merge_preprocess(
     source_mask = np.in1d(inactive[:, 0], relevant_ccs[1])
     _inactive.append(inactive[source_mask & sink_mask])
     _inactive = np.concatenate(_inactive)
-    return np.unique(_inactive, axis=0) if _inactive.size else types.empty_2d
+    return unique_rows(_inactive) if _inactive.size else types.empty_2d
 
 
 def check_fake_edges(
@@ -265,23 +268,38 @@ def _process_l2_agglomeration(
     return flatgraph.connected_components(graph), graph_ids, cross_edges
 
 
-def _filter_component_cross_edges(
-    cc_ids: np.ndarray, cross_edges: np.ndarray, cross_edge_layers: np.ndarray
-) -> Dict[int, np.ndarray]:
+def _filter_components_cross_edges(
+    ccs: List[np.ndarray],
+    graph_ids: np.ndarray,
+    cross_edges: np.ndarray,
+    cross_edge_layers: np.ndarray,
+) -> List[Dict[int, np.ndarray]]:
     """
-    Filters cross edges for a connected component `cc_ids`
+    Filters cross edges for each connected component in `ccs`
     from `cross_edges` of the complete chunk.
+    Edges are assigned to components with one lookup in sorted `graph_ids`,
+    instead of scanning all edges once per component.
     """
-    mask = np.in1d(cross_edges[:, 0], cc_ids)
-    cross_edges_ = cross_edges[mask]
-    cross_edge_layers_ = cross_edge_layers[mask]
-    edges_d = {}
-    for layer in np.unique(cross_edge_layers_):
-        edge_m = cross_edge_layers_ == layer
-        _cross_edges = cross_edges_[edge_m]
-        if _cross_edges.size:
-            edges_d[layer] = _cross_edges
-    return edges_d
+    if not graph_ids.size:
+        return [{} for _ in ccs]
+    cc_labels = np.zeros(graph_ids.size, dtype=int)
+    for i_cc, cc in enumerate(ccs):
+        cc_labels[cc] = i_cc
+    idx = np.minimum(np.searchsorted(graph_ids, cross_edges[:, 0]), graph_ids.size - 1)
+    edge_labels = np.where(graph_ids[idx] == cross_edges[:, 0], cc_labels[idx], -1)
+    order = np.argsort(edge_labels, kind="stable")
+    bounds = np.searchsorted(edge_labels[order], np.arange(len(ccs) + 1))
+
+    result = []
+    for i_cc in range(len(ccs)):
+        selected = order[bounds[i_cc] : bounds[i_cc + 1]]
+        cross_edges_ = cross_edges[selected]
+        cross_edge_layers_ = cross_edge_layers[selected]
+        edges_d = {}
+        for layer in np.unique(cross_edge_layers_):
+            edges_d[layer] = cross_edges_[cross_edge_layers_ == layer]
+        result.append(edges_d)
+    return result
 
 
 def remove_edges(
@@ -317,12 +335,13 @@ def remove_edges(
         new_parent_ids = cg.id_client.create_node_ids(
             l2id_chunk_id_d[l2_agg.node_id], len(ccs)
         )
+        ccs_cross_edges = _filter_components_cross_edges(
+            ccs, graph_ids, cross_edges, cross_edge_layers
+        )
         for i_cc, cc in enumerate(ccs):
             new_id = new_parent_ids[i_cc]
             cg.cache.children_cache[new_id] = graph_ids[cc]
-            cg.cache.atomic_cx_edges_cache[new_id] = _filter_component_cross_edges(
-                graph_ids[cc], cross_edges, cross_edge_layers
-            )
+            cg.cache.atomic_cx_edges_cache[new_id] = ccs_cross_edges[i_cc]
             cache_utils.update(cg.cache.parents_cache, graph_ids[cc], new_id)
             new_l2_ids.append(new_id)
             new_old_id_d[new_id].add(id_)
@@ -418,10 +437,9 @@ class CreateParentNodes:
             )
 
         sv_parent_d, sv_cross_edges = self._map_sv_to_parent(node_ids, layer)
-        get_sv_parents = np.vectorize(sv_parent_d.get, otypes=[np.uint64])
         try:
-            cross_edges = get_sv_parents(sv_cross_edges)
-        except TypeError:  # NoneType error
+            cross_edges = fastremap.remap(sv_cross_edges, sv_parent_d)
+        except KeyError:
             # if there is a missing parent, try including lower layer ids
             # this can happen due to skip connections
 
@@ -433,8 +451,7 @@ class CreateParentNodes:
             sv_parent_d, sv_cross_edges = self._map_sv_to_parent(
                 _node_ids, layer, node_map=node_map
             )
-            get_sv_parents = np.vectorize(sv_parent_d.get, otypes=[np.uint64])
-            cross_edges = get_sv_parents(sv_cross_edges)
+            cross_edges = fastremap.remap(sv_cross_edges, sv_parent_d)
 
         cross_edges = np.concatenate([cross_edges, np.vstack([node_ids, node_ids]).T])
         graph, _, _, graph_ids = flatgraph.build_gt_graph(
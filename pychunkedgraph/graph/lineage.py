@@ -24,14 +24,18 @@ def get_latest_root_id(cg, root_id: NODE_ID.type) -> np.ndarray:
     id_working_set = [root_id]
     latest_root_ids = []
     while len(id_working_set) > 0:
-        next_id = id_working_set[0]
-        del id_working_set[0]
-        node = cg.client.read_node(next_id, properties=attributes.Hierarchy.NewParent)
-        # Check if a new root id was attached to this root id
-        if node:
-            id_working_set.extend(node[0].value)
-        else:
-            latest_root_ids.append(next_id)
+        # one read per generation of root ids instead of one per root id
+        nodes_d = cg.client.read_nodes(
+            node_ids=id_working_set, properties=attributes.Hierarchy.NewParent
+        )
+        next_working_set = []
+        for next_id in id_working_set:
+            # Check if a new root id was attached to this root id
+            if next_id in nodes_d:
+                next_working_set.extend(nodes_d[next_id][0].value)
+            else:
+                latest_root_ids.append(next_id)
+        id_working_set = next_working_set
     return np.unique(latest_root_ids)
 
 
@@ -49,11 +53,12 @@ def get_future_root_ids(
     next_ids = [root_id]
     while len(next_ids):
         temp_next_ids = []
+        nodes_d = cg.client.read_nodes(
+            node_ids=next_ids,
+            properties=[attributes.Hierarchy.NewParent, attributes.Hierarchy.Child],
+        )
         for next_id in next_ids:
-            node = cg.client.read_node(
-                next_id,
-                properties=[attributes.Hierarchy.NewParent, attributes.Hierarchy.Child],
-            )
+            node = nodes_d.get(next_id, {})
             if attributes.Hierarchy.NewParent in node:
                 ids = node[attributes.Hierarchy.NewParent][0].value
                 row_time_stamp = node[attributes.Hierarchy.NewParent][0].timestamp
@@ -85,14 +90,15 @@ def get_past_root_ids(
     next_ids = [root_id]
     while len(next_ids):
         temp_next_ids = []
+        nodes_d = cg.client.read_nodes(
+            node_ids=next_ids,
+            properties=[
+                attributes.Hierarchy.FormerParent,
+                attributes.Hierarchy.Child,
+            ],
+        )
         for next_id in next_ids:
-            node = cg.client.read_node(
-                next_id,
-                properties=[
-                    attributes.Hierarchy.FormerParent,
-                    attributes.Hierarchy.Child,
-                ],
-            )
+            node = nodes_d.get(next_id, {})
             if attributes.Hierarchy.FormerParent in node:
                 ids = node[attributes.Hierarchy.FormerParent][0].value
                 row_time_stamp = node[attributes.Hierarchy.FormerParent][0].timestamp
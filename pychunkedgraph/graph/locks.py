@@ -71,8 +71,7 @@ class RootLock:
 
     def __exit__(self, exception_type, exception_value, traceback):
         if self.lock_acquired:
-            for locked_root_id in self.locked_root_ids:
-                self.cg.client.unlock_root(locked_root_id, self.operation_id)
+            self.cg.client.unlock_roots(self.locked_root_ids, self.operation_id)
 
 
 class IndefiniteRootLock:
@@ -128,7 +127,6 @@ class IndefiniteRootLock:
 
     def __exit__(self, exception_type, exception_value, traceback):
         if self.acquired:
-            for locked_root_id in self.root_ids:
-                self.cg.client.unlock_indefinitely_locked_root(
-                    locked_root_id, self.operation_id
-                )
+            self.cg.client.unlock_indefinitely_locked_roots(
+                self.root_ids, self.operation_id
+            )
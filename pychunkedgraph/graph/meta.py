@@ -150,11 +150,11 @@ class ChunkedGraphMeta:
         chunks_boundary = get_chunks_boundary(
             self.voxel_counts, np.array(self._graph_config.CHUNK_SIZE, dtype=int)
         )
-        layer_bounds_d = {}
-        for layer in range(2, self.layer_count):
-            layer_bounds = chunks_boundary / (2 ** (layer - 2))
-            layer_bounds_d[layer] = np.ceil(layer_bounds).astype(int)
-        self._layer_bounds_d = layer_bounds_d
+        # bounds of all layers in one broadcast, one row per layer
+        layers = np.arange(2, self.layer_count)
+        scale = 2 ** (layers - 2)
+        layer_bounds = np.ceil(chunks_boundary / scale[:, None]).astype(int)
+        self._layer_bounds_d = dict(zip(layers.tolist(), layer_bounds))
         return self._layer_bounds_d
 
     @layer_chunk_bounds.setter
@@ -11,7 +11,6 @@ from typing import Tuple
 from typing import Union
 from typing import Optional
 from typing import Sequence
-from functools import reduce
 
 import numpy as np
 from google.cloud import bigtable
@@ -20,8 +19,8 @@ from . import locks
 from . import edits
 from . import types
 from . import attributes
-from .edges import Edges
 from .edges.utils import get_edges_status
+from .edges.utils import concatenate_edges
 from .utils import basetypes
 from .utils import serializers
 from .cache import CacheService
@@ -896,7 +895,7 @@ class MulticutOperation(GraphEditOperation):
                 root_ids.pop(), bbox=bbox, bbox_is_coordinate=True
             )
 
-            edges = reduce(lambda x, y: x + y, edges, Edges([], []))
+            edges = concatenate_edges(edges)
             supervoxels = np.concatenate(
                 [agg.supervoxels for agg in l2id_agglomeration_d.values()]
             )
@@ -186,8 +186,8 @@ def _get_subgraph_multiple_nodes(
     return_flattened: bool = False
 ):
     from collections import ChainMap
+    from concurrent.futures import ThreadPoolExecutor
     from multiwrapper.multiprocessing_utils import n_cpus
-    from multiwrapper.multiprocessing_utils import multithread_func
 
     from .utils.generic import mask_nodes_by_bounding_box
 
@@ -222,18 +222,26 @@ def _get_subgraph_multiple_nodes(
         bounding_box = np.array(bounding_box)
 
     subgraph = SubgraphProgress(cg.meta, node_ids, return_layers, serializable)
-    while not subgraph.done_processing():
-        this_n_threads = min(
-            [int(len(subgraph.cur_nodes) // 50000) + 1, n_cpus]
-        )
-        cur_nodes_child_maps = multithread_func(
-            _get_subgraph_multiple_nodes_threaded,
-            np.array_split(subgraph.cur_nodes, this_n_threads),
-            n_threads=this_n_threads,
-            debug=this_n_threads == 1,
-        )
-        cur_nodes_children = dict(ChainMap(*cur_nodes_child_maps))
-        subgraph.process_batch_of_children(cur_nodes_children)
+    # many small batches instead of one per thread, fanout is uneven
+    # so idle threads pick up remaining batches instead of waiting
+    batch_size = 4096
+    with ThreadPoolExecutor(max_workers=n_cpus) as executor:
+        while not subgraph.done_processing():
+            cur_nodes = subgraph.cur_nodes
+            batches = [
+                cur_nodes[i : i + batch_size]
+                for i in range(0, len(cur_nodes), batch_size)
+            ]
+            if len(batches) == 1:
+                cur_nodes_child_maps = [
+                    _get_subgraph_multiple_nodes_threaded(batches[0])
+                ]
+            else:
+                cur_nodes_child_maps = executor.map(
+                    _get_subgraph_multiple_nodes_threaded, batches
+                )
+            cur_nodes_children = dict(ChainMap(*cur_nodes_child_maps))
+            subgraph.process_batch_of_children(cur_nodes_children)
 
     if return_flattened and len(return_layers) == 1:
         for node_id in node_ids:
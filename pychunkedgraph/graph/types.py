@@ -19,7 +19,8 @@ a level 2 ID and it's supervoxels and edges.
     edges between supervoxels of agglomeration
     and neighboring agglomeration.
 `cross_edges_d`
-    dict of cross edges {layer: cross_edges_relevant_on_that_layer}
+    dict of cross edges {layer: cross_edges_relevant_on_that_layer},
+    None when not set.
 """
 _agglomeration_fields = (
     "node_id",
@@ -29,13 +30,14 @@ _agglomeration_fields = (
     "cross_edges",
     "cross_edges_d",
 )
+# defaults are created once and shared by all instances
 _agglomeration_defaults = (
     None,
-    empty_1d.copy(),
-    empty_2d.copy(),
-    empty_2d.copy(),
-    empty_2d.copy(),
-    {},
+    empty_1d,
+    empty_2d,
+    empty_2d,
+    empty_2d,
+    None,
 )
 Agglomeration = namedtuple(
     "Agglomeration", _agglomeration_fields, defaults=_agglomeration_defaults
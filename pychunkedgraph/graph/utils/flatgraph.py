@@ -16,7 +16,7 @@ def build_gt_graph(
     :param hashed: bool
     :return: graph, capacities
     """
-    edges = np.array(edges, np.uint64)
+    edges = np.asarray(edges, np.uint64)
     if weights is not None:
         assert len(weights) == len(edges)
         weights = np.array(weights)
@@ -24,8 +24,6 @@ def build_gt_graph(
     unique_ids, edges = np.unique(edges, return_inverse=True)
     edges = edges.reshape(-1, 2)
 
-    edges = np.array(edges)
-
     if make_directed:
         is_directed = True
         edges = np.concatenate([edges, edges[:, [1, 0]]])
@@ -65,6 +63,21 @@ def connected_components(graph):
     return np.split(idx_sort, idx_start[1:])
 
 
+def component_labels(ccs, n_vertices):
+    """Index of the connected component of each vertex, inverse of `ccs`.
+    Membership tests against many components become a single lookup
+    instead of an `np.in1d` per component.
+    :param ccs: list of vertex arrays, as returned by `connected_components`
+    :param n_vertices: int
+    :return: np.array of len == n_vertices
+    """
+    labels = np.full(n_vertices, -1, dtype=int)
+    if len(ccs):
+        sizes = [len(cc) for cc in ccs]
+        labels[np.concatenate(ccs)] = np.repeat(np.arange(len(ccs)), sizes)
+    return labels
+
+
 def team_paths_all_to_all(graph, capacity, team_vertex_ids):
     dprop = capacity.copy()
     # Use inverse affinity as the distance between vertices.
@@ -148,13 +148,14 @@ def _get_google_compatible_time_stamp(
     :param round_up: bool
     :return: datetime.datetime
     """
-    micro_s_gap = datetime.timedelta(microseconds=time_stamp.microsecond % 1000)
+    # compare the int gap, a timedelta never equals 0 and was always subtracted
+    micro_s_gap = time_stamp.microsecond % 1000
     if micro_s_gap == 0:
         return time_stamp
     if round_up:
-        time_stamp += datetime.timedelta(microseconds=1000) - micro_s_gap
+        time_stamp += datetime.timedelta(microseconds=1000 - micro_s_gap)
     else:
-        time_stamp -= micro_s_gap
+        time_stamp -= datetime.timedelta(microseconds=micro_s_gap)
     return time_stamp
 
 
@@ -166,10 +167,15 @@ def mask_nodes_by_bounding_box(
     if bounding_box is None:
         return np.ones(len(nodes), bool)
     else:
-        chunk_coordinates = np.array(
-            [chunk_utils.get_chunk_coordinates(meta, c) for c in nodes]
-        )
+        nodes = np.array(nodes, dtype=np.uint64)
         layers = chunk_utils.get_chunk_layers(meta, nodes)
+        # coordinates are extracted for all nodes of a layer at once
+        chunk_coordinates = np.zeros((len(nodes), 3), dtype=int)
+        for layer in np.unique(layers):
+            layer_mask = layers == layer
+            chunk_coordinates[layer_mask] = chunk_utils.get_chunk_coordinates_multiple(
+                meta, nodes[layer_mask]
+            )
         adapt_layers = layers - 2
         adapt_layers[adapt_layers < 0] = 0
         fanout = meta.graph_config.FANOUT
@@ -7,6 +7,7 @@ from typing import Sequence
 from typing import Callable
 from datetime import datetime
 
+import fastremap
 import numpy as np
 
 from . import basetypes
@@ -51,7 +52,7 @@ def get_node_id(
 
 def get_atomic_id_from_coord(
     meta: ChunkedGraphMeta,
-    get_root: callable,
+    get_roots: Callable,
     x: int,
     y: int,
     z: int,
@@ -64,9 +65,11 @@ def get_atomic_id_from_coord(
     y = int(y / 2 ** meta.data_source.CV_MIP)
     z = int(z)
 
-    checked = []
+    checked = set()
     atomic_id = None
-    root_id = get_root(parent_id, time_stamp=time_stamp)
+    root_id = get_roots(
+        np.array([parent_id], dtype=basetypes.NODE_ID), time_stamp=time_stamp
+    )[0]
 
     for i_try in range(n_tries):
         # Define block size -- increase by one each try
@@ -84,27 +87,31 @@ def get_atomic_id_from_coord(
 
         # Get atomic ids from cloudvolume
         atomic_id_block = meta.cv[x_l:x_h, y_l:y_h, z_l:z_h]
-        atomic_ids, atomic_id_count = np.unique(atomic_id_block, return_counts=True)
+        # fastremap counts without sorting the block, unlike np.unique
+        atomic_ids, atomic_id_count = fastremap.unique(
+            atomic_id_block, return_counts=True
+        )
 
         # sort by frequency and discard those ids that have been checked
         # previously
-        sorted_atomic_ids = atomic_ids[np.argsort(atomic_id_count)]
-        sorted_atomic_ids = sorted_atomic_ids[~np.in1d(sorted_atomic_ids, checked)]
-
-        # For each candidate id check whether its root id corresponds to the
-        # given root id
-        for candidate_atomic_id in sorted_atomic_ids:
-            if candidate_atomic_id != 0:
-                ass_root_id = get_root(candidate_atomic_id, time_stamp=time_stamp)
-                if ass_root_id == root_id:
-                    # atomic_id is not None will be our indicator that the
-                    # search was successful
-                    atomic_id = candidate_atomic_id
-                    break
-                else:
-                    checked.append(candidate_atomic_id)
-        if atomic_id is not None:
+        sorted_atomic_ids = atomic_ids[np.argsort(atomic_id_count)].tolist()
+        sorted_atomic_ids = np.array(
+            [id_ for id_ in sorted_atomic_ids if id_ and id_ not in checked],
+            dtype=basetypes.NODE_ID,
+        )
+        if not sorted_atomic_ids.size:
+            continue
+
+        # check all candidates at once, a candidate is valid
+        # if its root id corresponds to the given root id
+        ass_root_ids = get_roots(sorted_atomic_ids, time_stamp=time_stamp)
+        hits = np.where(ass_root_ids == root_id)[0]
+        if hits.size:
+            # atomic_id is not None will be our indicator that the
+            # search was successful
+            atomic_id = sorted_atomic_ids[hits[0]]
             break
+        checked.update(sorted_atomic_ids.tolist())
     # Returns None if unsuccessful
     return atomic_id
 
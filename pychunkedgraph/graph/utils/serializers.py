@@ -1,10 +1,34 @@
 from typing import Any, Iterable
 import json
 import pickle
+import threading
 
 import numpy as np
 import zstandard as zstd
 
+# zstd contexts are expensive to create and not safe to share between threads
+_zstd_local = threading.local()
+
+
+def _get_compressor(level: int) -> zstd.ZstdCompressor:
+    try:
+        compressors = _zstd_local.compressors
+    except AttributeError:
+        compressors = _zstd_local.compressors = {}
+    try:
+        return compressors[level]
+    except KeyError:
+        compressors[level] = zstd.ZstdCompressor(level=level)
+        return compressors[level]
+
+
+def _get_decompressor() -> zstd.ZstdDecompressor:
+    try:
+        return _zstd_local.decompressor
+    except AttributeError:
+        _zstd_local.decompressor = zstd.ZstdDecompressor()
+        return _zstd_local.decompressor
+
 
 class _Serializer:
     def __init__(self, serializer, deserializer, basetype=Any, compression_level=None):
@@ -16,12 +40,12 @@ class _Serializer:
     def serialize(self, obj):
         content = self._serializer(obj)
         if self._compression_level:
-            return zstd.ZstdCompressor(level=self._compression_level).compress(content)
+            return _get_compressor(self._compression_level).compress(content)
         return content
 
     def deserialize(self, obj):
         if self._compression_level:
-            obj = zstd.ZstdDecompressor().decompressobj().decompress(obj)
+            obj = _get_decompressor().decompressobj().decompress(obj)
         return self._deserializer(obj)
 
     @property
@@ -40,8 +64,16 @@ class NumPyArray(_Serializer):
         return data
 
     def __init__(self, dtype, shape=None, order=None, compression_level=None):
+        def _serialize(x):
+            x = x.newbyteorder(dtype.byteorder)
+            if compression_level:
+                # compressor reads the array buffer, skips copying it to bytes
+                # flattened first, memoryview can't cast empty n-d arrays
+                return np.ascontiguousarray(x).reshape(-1).view(np.uint8)
+            return x.tobytes()
+
         super().__init__(
-            serializer=lambda x: x.newbyteorder(dtype.byteorder).tobytes(),
+            serializer=_serialize,
             deserializer=lambda x: NumPyArray._deserialize(
                 x, dtype, shape=shape, order=order
             ),
@@ -110,11 +142,12 @@ def serialize_uint64(node_id: np.uint64, counter=False, fake_edges=False) -> byt
     :param node_id: int
     :return: str
     """
+    # bytes formatting, skips building and encoding an intermediate str
     if counter:
-        return serialize_key("i%s" % pad_node_id(node_id))  # type: ignore
+        return b"i%.20d" % node_id
     if fake_edges:
-        return serialize_key("f%s" % pad_node_id(node_id))  # type: ignore
-    return serialize_key(pad_node_id(node_id))  # type: ignore
+        return b"f%.20d" % node_id
+    return b"%.20d" % node_id
 
 
 def serialize_uint64s_to_regex(node_ids: Iterable[np.uint64]) -> bytes:
@@ -123,8 +156,7 @@ def serialize_uint64s_to_regex(node_ids: Iterable[np.uint64]) -> bytes:
     :param node_id: int
     :return: str
     """
-    node_id_str = "".join(["%s|" % pad_node_id(node_id) for node_id in node_ids])[:-1]
-    return serialize_key(node_id_str)  # type: ignore
+    return b"|".join([b"%.20d" % node_id for node_id in node_ids])
 
 
 def deserialize_uint64(node_id: bytes, fake_edges=False) -> np.uint64:
@@ -134,8 +166,8 @@ def deserialize_uint64(node_id: bytes, fake_edges=False) -> np.uint64:
     :return: np.uint64
     """
     if fake_edges:
-        return np.uint64(node_id[1:].decode())  # type: ignore
-    return np.uint64(node_id.decode())  # type: ignore
+        return np.uint64(int(node_id[1:]))  # type: ignore
+    return np.uint64(int(node_id))  # type: ignore
 
 
 def serialize_key(key: str) -> bytes:
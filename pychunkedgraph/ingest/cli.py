@@ -85,6 +85,7 @@ def queue_layer(parent_layer):
     """
     from itertools import product
     import numpy as np
+    from rq import Queue as RQueue
     from .cluster import create_parent_chunk
     from .utils import chunk_id_str
 
@@ -99,15 +100,24 @@ def queue_layer(parent_layer):
         chunk_coords = list(product(*[range(r) for r in bounds]))
         np.random.shuffle(chunk_coords)
 
+    # jobs are submitted in batches, one redis pipeline per batch
+    batch_size = 1000
+    task_q = imanager.get_task_queue(f"l{parent_layer}")
+    job_datas = []
     for coords in chunk_coords:
-        task_q = imanager.get_task_queue(f"l{parent_layer}")
-        task_q.enqueue(
-            create_parent_chunk,
-            job_id=chunk_id_str(parent_layer, coords),
-            job_timeout=f"{int(parent_layer * parent_layer)}m",
-            result_ttl=0,
-            args=(parent_layer, coords),
+        job_datas.append(
+            RQueue.prepare_data(
+                create_parent_chunk,
+                args=(parent_layer, coords),
+                timeout=f"{int(parent_layer * parent_layer)}m",
+                result_ttl=0,
+                job_id=chunk_id_str(parent_layer, coords),
+            )
         )
+        if len(job_datas) == batch_size:
+            task_q.enqueue_many(job_datas)
+            job_datas = []
+    task_q.enqueue_many(job_datas)
 
 
 @ingest_cli.command("status")
@@ -116,9 +126,15 @@ def ingest_status():
     redis = get_redis_connection()
     imanager = IngestionManager.from_pickle(redis.get(r_keys.INGESTION_MANAGER))
     layers = range(2, imanager.cg_meta.layer_count + 1)
-    for layer, layer_count in zip(layers, imanager.cg_meta.layer_chunk_counts):
-        completed = redis.scard(f"{layer}c")
-        print(f"{layer}\t: {completed} / {layer_count}")
+    # completed counts of all layers in one round trip
+    pipeline = redis.pipeline(transaction=False)
+    for layer in layers:
+        pipeline.scard(f"{layer}c")
+    completed = pipeline.execute()
+    for layer, done, layer_count in zip(
+        layers, completed, imanager.cg_meta.layer_chunk_counts
+    ):
+        print(f"{layer}\t: {done} / {layer_count}")
 
 
 @ingest_cli.command("chunk")
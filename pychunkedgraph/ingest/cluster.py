@@ -14,36 +14,41 @@ from .create.atomic_layer import add_atomic_edges
 from .create.abstract_layers import add_layer
 from ..graph.meta import ChunkedGraphMeta
 from ..graph.chunks.hierarchy import get_children_chunk_coords
+from ..graph.chunks.hierarchy import get_children_chunk_count
 from ..utils.redis import keys as r_keys
 from ..utils.redis import get_redis_connection
+from ..utils.general import chunked
 
 
 def _post_task_completion(imanager: IngestionManager, layer: int, coords: np.ndarray):
     from os import environ
 
     chunk_str = "_".join(map(str, coords))
-    # mark chunk as completed - "c"
-    imanager.redis.sadd(f"{layer}c", chunk_str)
-
-    if environ.get("DO_NOT_AUTOQUEUE_PARENT_CHUNKS", None) is not None:
-        return
-
     parent_layer = layer + 1
-    if parent_layer > imanager.cg_meta.layer_count:
+    if (
+        environ.get("DO_NOT_AUTOQUEUE_PARENT_CHUNKS", None) is not None
+        or parent_layer > imanager.cg_meta.layer_count
+    ):
+        # mark chunk as completed - "c"
+        imanager.redis.sadd(f"{layer}c", chunk_str)
         return
 
     parent_coords = np.array(coords, int) // imanager.cg_meta.graph_config.FANOUT
     parent_id_str = chunk_id_str(parent_layer, parent_coords)
-    imanager.redis.sadd(parent_id_str, chunk_str)
-
     parent_chunk_str = "_".join(map(str, parent_coords))
-    if not imanager.redis.hget(parent_layer, parent_chunk_str):
-        # cache children chunk count
-        # checked by tracker worker to enqueue parent chunk
-        children_count = len(
-            get_children_chunk_coords(imanager.cg_meta, parent_layer, parent_coords)
-        )
-        imanager.redis.hset(parent_layer, parent_chunk_str, children_count)
+    children_count = get_children_chunk_count(
+        imanager.cg_meta, parent_layer, parent_coords
+    )
+
+    # single round trip to redis for all updates
+    pipeline = imanager.redis.pipeline(transaction=False)
+    # mark chunk as completed - "c"
+    pipeline.sadd(f"{layer}c", chunk_str)
+    pipeline.sadd(parent_id_str, chunk_str)
+    # cache children chunk count if not set
+    # checked by tracker worker to enqueue parent chunk
+    pipeline.hsetnx(parent_layer, parent_chunk_str, children_count)
+    pipeline.execute()
 
     tracker_queue = imanager.get_task_queue(f"t{layer}")
     tracker_queue.enqueue(
@@ -63,11 +68,18 @@ def enqueue_parent_task(
     parent_coords: Sequence[int],
 ):
     redis = get_redis_connection()
-    imanager = IngestionManager.from_pickle(redis.get(r_keys.INGESTION_MANAGER))
     parent_id_str = chunk_id_str(parent_layer, parent_coords)
     parent_chunk_str = "_".join(map(str, parent_coords))
+    child_layer = parent_layer - 1
+
+    # read all progress counters in one round trip
+    pipeline = redis.pipeline(transaction=False)
+    pipeline.get(r_keys.INGESTION_MANAGER)
+    pipeline.scard(parent_id_str)
+    pipeline.scard(f"{child_layer}c")
+    pipeline.hget(parent_layer, parent_chunk_str)
+    imanager, children_done, child_layer_done, children_count = pipeline.execute()
 
-    children_done = redis.scard(parent_id_str)
     # if zero then this key was deleted and parent already queued.
     if children_done == 0:
         print("parent already queued.")
@@ -75,13 +87,12 @@ def enqueue_parent_task(
 
     # if the previous layer is complete
     # no need to check children progress for each parent chunk
-    child_layer = parent_layer - 1
-    child_layer_done = redis.scard(f"{child_layer}c")
+    imanager = IngestionManager.from_pickle(imanager)
     child_layer_count = imanager.cg_meta.layer_chunk_counts[child_layer - 2]
     child_layer_finished = child_layer_done == child_layer_count
 
     if not child_layer_finished:
-        children_count = int(redis.hget(parent_layer, parent_chunk_str).decode("utf-8"))
+        children_count = int(children_count.decode("utf-8"))
         if children_done != children_count:
             print("children not done.")
             return
@@ -97,8 +108,10 @@ def enqueue_parent_task(
             parent_coords,
         ),
     )
-    redis.hdel(parent_layer, parent_chunk_str)
-    redis.delete(parent_id_str)
+    pipeline = redis.pipeline(transaction=False)
+    pipeline.hdel(parent_layer, parent_chunk_str)
+    pipeline.delete(parent_id_str)
+    pipeline.execute()
 
 
 def create_parent_chunk(
@@ -121,10 +134,11 @@ def create_parent_chunk(
 
 
 def randomize_grid_points(X: int, Y: int, Z: int) -> Tuple[int, int, int]:
-    indices = np.arange(X * Y * Z)
-    np.random.shuffle(indices)
-    for index in indices:
-        yield np.unravel_index(index, (X, Y, Z))
+    count = X * Y * Z
+    indices = np.random.permutation(np.arange(count, dtype=np.min_scalar_type(count)))
+    # unravel in batches, coordinates are only created as they are consumed
+    for batch in chunked(indices, 10000):
+        yield from zip(*np.unravel_index(batch, (X, Y, Z)))
 
 
 def enqueue_atomic_tasks(imanager: IngestionManager):
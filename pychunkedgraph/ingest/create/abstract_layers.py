@@ -7,6 +7,7 @@ import math
 import datetime
 import multiprocessing as mp
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from typing import Sequence
 from typing import List
@@ -26,6 +27,7 @@ from ...graph.utils.generic import filter_failed_node_ids
 from ...graph.chunks.hierarchy import get_children_chunk_coords
 from ...graph.connectivity.cross_edges import get_children_chunk_cross_edges
 from ...graph.connectivity.cross_edges import get_chunk_nodes_cross_edge_layer
+from .writer import RowWriter
 
 
 def add_layer(
@@ -58,8 +60,8 @@ def add_layer(
     # add_node_ids = children_ids[isolated_node_mask].squeeze()
     add_edge_ids = np.vstack([children_ids, children_ids]).T
 
-    edge_ids = list(edge_ids)
-    edge_ids.extend(add_edge_ids)
+    edge_ids = np.asarray(edge_ids, dtype=basetypes.NODE_ID).reshape(-1, 2)
+    edge_ids = np.concatenate([edge_ids, add_edge_ids])
     graph, _, _, graph_ids = flatgraph.build_gt_graph(edge_ids, make_directed=True)
     ccs = flatgraph.connected_components(graph)
     print("ccs", len(ccs))
@@ -78,38 +80,22 @@ def add_layer(
 def _read_children_chunks(
     cg: ChunkedGraph, layer_id, children_coords, use_threads=True
 ):
-    if not use_threads:
+    if not use_threads or len(children_coords) < 2:
         children_ids = [types.empty_1d]
         for child_coord in children_coords:
             children_ids.append(_read_chunk([], cg, layer_id - 1, child_coord))
         return np.concatenate(children_ids)
 
+    # reads are I/O bound, threads share the client instead of
+    # each process creating its own chunkedgraph instance
     print("_read_children_chunks")
-    with mp.Manager() as manager:
-        children_ids_shared = manager.list()
-        multi_args = []
-        for child_coord in children_coords:
-            multi_args.append(
-                (
-                    children_ids_shared,
-                    cg.get_serialized_info(),
-                    layer_id - 1,
-                    child_coord,
-                )
-            )
-        mu.multiprocess_func(
-            _read_chunk_helper,
-            multi_args,
-            n_threads=min(len(multi_args), mp.cpu_count()),
+    with ThreadPoolExecutor(max_workers=min(len(children_coords), 16)) as executor:
+        children_ids = executor.map(
+            lambda coord: _read_chunk([], cg, layer_id - 1, coord), children_coords
         )
-        print("_read_children_chunks done")
-        return np.concatenate(children_ids_shared)
-
-
-def _read_chunk_helper(args):
-    children_ids_shared, cg_info, layer_id, chunk_coord = args
-    cg = ChunkedGraph(**cg_info)
-    _read_chunk(children_ids_shared, cg, layer_id, chunk_coord)
+        children_ids = np.concatenate([types.empty_1d, *children_ids])
+    print("_read_children_chunks done")
+    return children_ids
 
 
 def _read_chunk(children_ids_shared, cg: ChunkedGraph, layer_id: int, chunk_coord):
@@ -203,45 +189,41 @@ def _write(
             layer = node_layer_d_shared.get(node_ids[0], cg.meta.layer_count)
         cc_connections[layer].append(node_ids)
 
-    rows = []
     x, y, z = parent_coords
     parent_chunk_id = cg.get_chunk_id(layer=layer_id, x=x, y=y, z=z)
     parent_chunk_id_dict = cg.get_parent_chunk_id_dict(parent_chunk_id)
 
-    # Iterate through layers
-    for parent_layer_id in parent_layer_ids:
-        if len(cc_connections[parent_layer_id]) == 0:
-            continue
+    with RowWriter(cg) as writer:
+        # Iterate through layers
+        for parent_layer_id in parent_layer_ids:
+            if len(cc_connections[parent_layer_id]) == 0:
+                continue
+
+            parent_chunk_id = parent_chunk_id_dict[parent_layer_id]
+            reserved_parent_ids = cg.id_client.create_node_ids(
+                parent_chunk_id,
+                size=len(cc_connections[parent_layer_id]),
+                root_chunk=parent_layer_id == cg.meta.layer_count and use_threads,
+            )
 
-        parent_chunk_id = parent_chunk_id_dict[parent_layer_id]
-        reserved_parent_ids = cg.id_client.create_node_ids(
-            parent_chunk_id,
-            size=len(cc_connections[parent_layer_id]),
-            root_chunk=parent_layer_id == cg.meta.layer_count and use_threads,
-        )
+            for i_cc, node_ids in enumerate(cc_connections[parent_layer_id]):
+                parent_id = reserved_parent_ids[i_cc]
+                rows = []
+                for node_id in node_ids:
+                    rows.append(
+                        cg.client.mutate_row(
+                            serializers.serialize_uint64(node_id),
+                            {attributes.Hierarchy.Parent: parent_id},
+                            time_stamp=time_stamp,
+                        )
+                    )
 
-        for i_cc, node_ids in enumerate(cc_connections[parent_layer_id]):
-            parent_id = reserved_parent_ids[i_cc]
-            for node_id in node_ids:
                 rows.append(
                     cg.client.mutate_row(
-                        serializers.serialize_uint64(node_id),
-                        {attributes.Hierarchy.Parent: parent_id},
+                        serializers.serialize_uint64(parent_id),
+                        {attributes.Hierarchy.Child: node_ids},
                         time_stamp=time_stamp,
                     )
                 )
-
-            rows.append(
-                cg.client.mutate_row(
-                    serializers.serialize_uint64(parent_id),
-                    {attributes.Hierarchy.Child: node_ids},
-                    time_stamp=time_stamp,
-                )
-            )
-
-            if len(rows) > 100000:
-                cg.client.write(rows)
-                print("wrote rows", len(rows), layer_id, parent_coords)
-                rows = []
-    cg.client.write(rows)
-    print("wrote rows", len(rows), layer_id, parent_coords)
+                writer.extend(rows)
+    print("wrote rows", writer.written, layer_id, parent_coords)
@@ -17,10 +17,11 @@ from ...graph.utils import basetypes
 from ...graph.utils import serializers
 from ...graph.edges import Edges
 from ...graph.edges import EDGE_TYPES
-from ...graph.utils.generic import compute_indices_pandas
 from ...graph.utils.generic import get_valid_timestamp
 from ...graph.utils.flatgraph import build_gt_graph
 from ...graph.utils.flatgraph import connected_components
+from ...utils.general import unique_1d
+from .writer import RowWriter
 
 
 def add_atomic_edges(
@@ -45,24 +46,19 @@ def add_atomic_edges(
     )
     parent_ids = cg.id_client.create_node_ids(parent_chunk_id, size=len(ccs))
 
-    sparse_indices, remapping = _get_remapping(chunk_edges_d)
+    sorted_edges, edge_slices = _get_out_edges_index(chunk_edges_d)
     time_stamp = get_valid_timestamp(time_stamp)
-    nodes = []
-    for i_cc, component in enumerate(ccs):
-        _nodes = _process_component(
-            cg,
-            chunk_edges_d,
-            parent_ids[i_cc],
-            unique_ids[component],
-            sparse_indices,
-            remapping,
-            time_stamp,
-        )
-        nodes.extend(_nodes)
-        if len(nodes) > 100000:
-            cg.client.write(nodes)
-            nodes = []
-    cg.client.write(nodes)
+    with RowWriter(cg) as writer:
+        for i_cc, component in enumerate(ccs):
+            _nodes = _process_component(
+                cg,
+                parent_ids[i_cc],
+                unique_ids[component],
+                sorted_edges,
+                edge_slices,
+                time_stamp,
+            )
+            writer.extend(_nodes)
 
 
 def _get_chunk_nodes_and_edges(chunk_edges_d: dict, isolated_ids: Sequence[int]):
@@ -79,40 +75,42 @@ def _get_chunk_nodes_and_edges(chunk_edges_d: dict, isolated_ids: Sequence[int])
             node_ids.append(edges.node_ids2)
             edge_ids.append(edges.get_pairs())
 
-    chunk_node_ids = np.unique(np.concatenate(node_ids))
+    chunk_node_ids = unique_1d(np.concatenate(node_ids))
     edge_ids.append(np.vstack([chunk_node_ids, chunk_node_ids]).T)
     return (chunk_node_ids, np.concatenate(edge_ids))
 
 
-def _get_remapping(chunk_edges_d: dict):
+def _get_out_edges_index(chunk_edges_d: dict):
     """
-    TODO add logic explanation
+    Edges pointing outside the chunk (between and cross), sorted by their first node
+    so the edges of each node are a contiguous slice; {node_id: (start, end)}.
     """
-    sparse_indices = {}
-    remapping = {}
+    sorted_edges = {}
+    edge_slices = {}
     for edge_type in [EDGE_TYPES.between_chunk, EDGE_TYPES.cross_chunk]:
-        edges = chunk_edges_d[edge_type].get_pairs()
-        u_ids, inv_ids = np.unique(edges, return_inverse=True)
-        mapped_ids = np.arange(len(u_ids), dtype=np.int32)
-        remapped_arr = mapped_ids[inv_ids].reshape(edges.shape)
-        sparse_indices[edge_type] = compute_indices_pandas(remapped_arr)
-        remapping[edge_type] = dict(zip(u_ids, mapped_ids))
-    return sparse_indices, remapping
+        edges = chunk_edges_d[edge_type]
+        # sort and index on the contiguous node_ids1 instead of a strided column
+        order = np.argsort(edges.node_ids1, kind="stable")
+        ids1 = edges.node_ids1[order]
+        u_ids, starts, counts = np.unique(ids1, return_index=True, return_counts=True)
+        sorted_edges[edge_type] = np.column_stack((ids1, edges.node_ids2[order]))
+        edge_slices[edge_type] = dict(
+            zip(u_ids, zip(starts.tolist(), (starts + counts).tolist()))
+        )
+    return sorted_edges, edge_slices
 
 
 def _process_component(
-    cg, chunk_edges_d, parent_id, node_ids, sparse_indices, remapping, time_stamp,
+    cg, parent_id, node_ids, sorted_edges, edge_slices, time_stamp,
 ):
     nodes = []
-    chunk_out_edges = []  # out = between + cross
     for node_id in node_ids:
-        _edges = _get_outgoing_edges(node_id, chunk_edges_d, sparse_indices, remapping)
-        chunk_out_edges.append(_edges)
         val_dict = {attributes.Hierarchy.Parent: parent_id}
         r_key = serializers.serialize_uint64(node_id)
         nodes.append(cg.client.mutate_row(r_key, val_dict, time_stamp=time_stamp))
 
-    chunk_out_edges = np.concatenate(chunk_out_edges)
+    # out = between + cross
+    chunk_out_edges = _get_outgoing_edges(node_ids, sorted_edges, edge_slices)
     cce_layers = cg.get_cross_chunk_edges_layer(chunk_out_edges)
     u_cce_layers = np.unique(cce_layers)
 
@@ -128,20 +126,23 @@ def _process_component(
     return nodes
 
 
-def _get_outgoing_edges(node_id, chunk_edges_d, sparse_indices, remapping):
+def _get_outgoing_edges(node_ids, sorted_edges, edge_slices):
     """
-    edges of node_id pointing outside the chunk (between and cross)
+    edges of node_ids pointing outside the chunk (between and cross)
+    slices are collected first so the edges are copied once into a preallocated array
     """
-    chunk_out_edges = np.array([], dtype=basetypes.NODE_ID).reshape(0, 2)
-    for edge_type in remapping:
-        if node_id in remapping[edge_type]:
-            edges_obj = chunk_edges_d[edge_type]
-            edges = edges_obj.get_pairs()
-
-            row_ids, column_ids = sparse_indices[edge_type][
-                remapping[edge_type][node_id]
-            ]
-            row_ids = row_ids[column_ids == 0]
+    slices = []
+    for node_id in node_ids:
+        for edge_type, edges in sorted_edges.items():
+            try:
+                start, end = edge_slices[edge_type][node_id]
+            except KeyError:
+                continue
             # edges that this node is part of
-            chunk_out_edges = np.concatenate([chunk_out_edges, edges[row_ids]])
+            slices.append((edges, start, end))
+
+    offsets = np.cumsum([0] + [end - start for _, start, end in slices])
+    chunk_out_edges = np.empty((offsets[-1], 2), dtype=basetypes.NODE_ID)
+    for (edges, start, end), offset in zip(slices, offsets.tolist()):
+        chunk_out_edges[offset : offset + end - start] = edges[start:end]
     return chunk_out_edges
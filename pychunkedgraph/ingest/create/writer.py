@@ -0,0 +1,54 @@
+"""
+Buffered bigtable writes for ingest.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
+
+from ...graph.chunkedgraph import ChunkedGraph
+
+
+class RowWriter:
+    """
+    Buffers mutated rows and writes them in the background once `batch_size` rows
+    are buffered, so building rows overlaps with writing them.
+    At most `max_pending` batches are in flight, a write error is raised when
+    another batch is submitted or when the context exits.
+    """
+
+    def __init__(
+        self, cg: ChunkedGraph, batch_size: int = 100000, max_pending: int = 2
+    ):
+        self._cg = cg
+        self._batch_size = batch_size
+        self._max_pending = max_pending
+        self._rows = []
+        self._pending = []
+        self._executor = ThreadPoolExecutor(max_workers=max_pending)
+        self.written = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if exc_type is None:
+                if self._rows:
+                    self._submit()
+                for future in self._pending:
+                    future.result()
+        finally:
+            self._executor.shutdown(wait=True, cancel_futures=exc_type is not None)
+
+    def extend(self, rows: Iterable) -> None:
+        self._rows.extend(rows)
+        if len(self._rows) >= self._batch_size:
+            self._submit()
+
+    def _submit(self) -> None:
+        if len(self._pending) >= self._max_pending:
+            # bounds buffered rows in memory
+            self._pending.pop(0).result()
+        rows, self._rows = self._rows, []
+        self._pending.append(self._executor.submit(self._cg.client.write, rows))
+        self.written += len(rows)
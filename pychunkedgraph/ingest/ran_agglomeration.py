@@ -13,7 +13,6 @@ from binascii import crc32
 
 
 import pandas as pd
-import networkx as nx
 import numpy as np
 import numpy.lib.recfunctions as rfn
 from cloudfiles import CloudFiles
@@ -27,6 +26,8 @@ from ..graph.edges import Edges
 from ..graph.edges import EDGE_TYPES
 from ..graph.types import empty_2d
 from ..graph.chunks.utils import get_chunk_id
+from ..graph.utils.flatgraph import build_gt_graph
+from ..graph.utils.flatgraph import connected_components
 
 # see section below for description
 CRC_LEN = 4
@@ -382,16 +383,18 @@ def read_raw_agglomeration_data(imanager: IngestionManager, chunk_coord: np.ndar
                 filenames.append(f"done_{mip_level}_{x}_{y}_{z}.data")
                 chunk_ids.append(adjacent_id)
 
-    edges_list = _read_agg_files(filenames, chunk_ids, path)
-    G = nx.Graph()
-    G.add_edges_from(np.concatenate(edges_list))
-    mapping = {}
-    components = list(nx.connected_components(G))
-    for i_cc, cc in enumerate(components):
-        cc = list(cc)
-        mapping.update(dict(zip(cc, [i_cc] * len(cc))))
+    edges = np.concatenate(_read_agg_files(filenames, chunk_ids, path))
+    if not edges.size:
+        return {}
 
-    if mapping and cg_meta.data_source.COMPONENTS:
+    # components as index arrays, no python object per node
+    graph, _, _, node_ids = build_gt_graph(edges, make_directed=True)
+    ccs = connected_components(graph)
+    components = [node_ids[cc] for cc in ccs]
+    labels = np.repeat(np.arange(len(ccs)), [len(cc) for cc in ccs])
+    mapping = dict(zip(np.concatenate(components), labels.tolist()))
+
+    if cg_meta.data_source.COMPONENTS:
         put_chunk_components(cg_meta.data_source.COMPONENTS, components, chunk_coord)
     return mapping
 
@@ -3,12 +3,14 @@
 Functions for reading and writing edges from cloud storage.
 """
 import os
+from threading import Lock
 from typing import Dict
 from typing import List
 from typing import Tuple
 
 import numpy as np
 import zstandard as zstd
+from cachetools import LRUCache
 from cloudfiles import CloudFiles
 
 from .protobuf.chunkEdges_pb2 import EdgesMsg
@@ -20,11 +22,16 @@ from ..graph.edges.utils import concatenate_chunk_edges
 
 
 def serialize(edges: Edges) -> EdgesMsg:
+    # astype copies only if the dtype differs, tobytes is the one copy
     edges_proto = EdgesMsg()
-    edges_proto.node_ids1 = edges.node_ids1.astype(basetypes.NODE_ID).tobytes()
-    edges_proto.node_ids2 = edges.node_ids2.astype(basetypes.NODE_ID).tobytes()
-    edges_proto.affinities = edges.affinities.astype(basetypes.EDGE_AFFINITY).tobytes()
-    edges_proto.areas = edges.areas.astype(basetypes.EDGE_AREA).tobytes()
+    node_ids1 = edges.node_ids1.astype(basetypes.NODE_ID, copy=False)
+    node_ids2 = edges.node_ids2.astype(basetypes.NODE_ID, copy=False)
+    affinities = edges.affinities.astype(basetypes.EDGE_AFFINITY, copy=False)
+    areas = edges.areas.astype(basetypes.EDGE_AREA, copy=False)
+    edges_proto.node_ids1 = node_ids1.tobytes()
+    edges_proto.node_ids2 = node_ids2.tobytes()
+    edges_proto.affinities = affinities.tobytes()
+    edges_proto.areas = areas.tobytes()
     return edges_proto
 
 
@@ -64,22 +71,73 @@ def _parse_edges(compressed: List[bytes]) -> List[Dict]:
     return result
 
 
-def get_chunk_edges(edges_dir: str, chunks_coordinates: List[np.ndarray]) -> Dict:
-    """Read edges from GCS."""
-    fnames = []
-    for chunk_coords in chunks_coordinates:
-        chunk_str = "_".join(str(coord) for coord in chunk_coords)
-        # filename format - edges_x_y_z.serialization.compression
-        fnames.append(f"edges_{chunk_str}.proto.zst")
+def _edges_d_nbytes(edges_d: Dict) -> int:
+    return sum(
+        e.node_ids1.nbytes + e.node_ids2.nbytes + e.affinities.nbytes + e.areas.nbytes
+        for e in edges_d.values()
+    )
+
 
-    cf = CloudFiles(edges_dir, num_threads=4)
+# parsed edges of a chunk, keyed by (edges_dir, filename), bounded by size in bytes
+# off by default, workers opt in with EDGES_CACHE_BYTES
+# entries are never invalidated, files rewritten in place are served stale
+_EDGES_CACHE = LRUCache(
+    maxsize=int(os.environ.get("EDGES_CACHE_BYTES", 0)),
+    getsizeof=_edges_d_nbytes,
+)
+_EDGES_CACHE_LOCK = Lock()
+
+
+def get_chunk_edges(
+    edges_dir: str, chunks_coordinates: List[np.ndarray], cache: bool = False
+) -> Dict:
+    """
+    Read edges from GCS.
+    With `cache=True` parsed edges are kept in an LRU cache across calls,
+    if enabled with EDGES_CACHE_BYTES. Only for edges that are not rewritten.
+    """
+    # filename format - edges_x_y_z.serialization.compression
+    # coordinates are converted to python ints once, not per element
+    fnames = [
+        f"edges_{x}_{y}_{z}.proto.zst"
+        for x, y, z in np.asarray(chunks_coordinates, dtype=int).reshape(-1, 3).tolist()
+    ]
+
+    result = []
+    cache = cache and _EDGES_CACHE.maxsize > 0
+    if cache:
+        with _EDGES_CACHE_LOCK:
+            for fname in fnames:
+                edges_d = _EDGES_CACHE.get((edges_dir, fname))
+                if edges_d is not None:
+                    result.append(edges_d)
+            fnames = [f for f in fnames if (edges_dir, f) not in _EDGES_CACHE]
+
+    if not fnames:
+        return concatenate_chunk_edges(result)
+
+    # files are downloaded concurrently, one thread per file up to 32
+    cf = CloudFiles(edges_dir, num_threads=min(len(fnames), 32))
     files = cf.get(fnames, raw=True)
+    paths = []
     compressed = []
     for f in files:
         if not f["content"]:
             continue
+        paths.append(f["path"])
         compressed.append(f["content"])
-    return concatenate_chunk_edges(_parse_edges(compressed))
+    parsed = _parse_edges(compressed)
+    result.extend(parsed)
+
+    if cache:
+        with _EDGES_CACHE_LOCK:
+            for path, edges_d in zip(paths, parsed):
+                try:
+                    _EDGES_CACHE[(edges_dir, path)] = edges_d
+                except ValueError:
+                    # larger than the whole cache
+                    pass
+    return concatenate_chunk_edges(result)
 
 
 def put_chunk_edges(
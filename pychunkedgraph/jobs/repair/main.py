@@ -3,19 +3,73 @@ Re run failed edit operations.
 These jobs get data (failed operations) from Google Datastore.
 """
 from ...graph import ChunkedGraph
-from ...export.models import OperationLog
+from ...export.models import OperationLogBase
 
 
-def _repair_operation(cg: ChunkedGraph, log: OperationLog):
-    from datetime import timedelta
-    from ...graph.operation import GraphEditOperation
+def _get_timestamp(log: OperationLogBase):
+    from ...export.models import from_microseconds
 
-    operation = GraphEditOperation.from_operation_id(
-        cg, log.id, multicut_as_split=False, privileged_mode=True
-    )
     ts = log["timestamp"]
+    if isinstance(ts, int):
+        # projection queries return timestamps as microseconds
+        ts = from_microseconds(ts)
+    return ts
+
+
+def _get_operation_roots(cg: ChunkedGraph, operation, ts) -> set:
+    """
+    Roots of the operation's supervoxels, before the operation and now.
+    Used to find operations that touch the same segments.
+    """
+    import numpy as np
+    from datetime import timedelta
+
+    svs = [np.array([], dtype=np.uint64)]
+    for attr in ("added_edges", "removed_edges", "source_ids", "sink_ids"):
+        ids = getattr(operation, attr, None)
+        if ids is not None:
+            svs.append(np.asarray(ids, dtype=np.uint64).ravel())
+    svs = np.unique(np.concatenate(svs))
+    roots = cg.get_roots(svs, time_stamp=ts - timedelta(seconds=0.1))
+    return set(roots.tolist()) | set(cg.get_roots(svs).tolist())
+
+
+def _group_by_roots(roots_per_item) -> list:
+    """
+    Indices of items grouped so that items sharing a root are in the same group.
+    `roots_per_item` is a list of sets of root IDs.
+    """
+    parent = list(range(len(roots_per_item)))
+
+    def _find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    root_owner = {}
+    for i, roots in enumerate(roots_per_item):
+        for root in roots:
+            j = root_owner.setdefault(root, i)
+            parent[_find(i)] = _find(j)
+
+    groups = {}
+    for i in range(len(roots_per_item)):
+        groups.setdefault(_find(i), []).append(i)
+    return list(groups.values())
+
+
+def _delete_keys(client, keys, batch_size: int = 500):
+    # datastore allows at most 500 keys per request
+    for i in range(0, len(keys), batch_size):
+        client.delete_multi(keys[i : i + batch_size])
+
+
+def _repair_operation(cg: ChunkedGraph, operation, operation_id, ts):
+    from datetime import timedelta
+
     result = operation.execute(
-        operation_id=log.id,
+        operation_id=operation_id,
         parent_ts=ts - timedelta(seconds=0.1),
         override_ts=ts + timedelta(microseconds=(ts.microsecond % 1000) + 10),
     )
@@ -23,14 +77,14 @@ def _repair_operation(cg: ChunkedGraph, log: OperationLog):
     old_roots = operation._update_root_ids()
     print("roots", old_roots, result.new_root_ids)
 
-    for root_ in old_roots:
-        cg.client.unlock_indefinitely_locked_root(root_, result.operation_id)
+    cg.client.unlock_indefinitely_locked_roots(old_roots, result.operation_id)
 
 
 def _repair_failed_operations(graph_id: str = None, datastore_ns: str = None):
     from os import environ
     from datetime import datetime
     from datetime import timedelta
+    from concurrent.futures import ThreadPoolExecutor
     from google.cloud import datastore
     from ...graph.operation import GraphEditOperation
 
@@ -53,12 +107,52 @@ def _repair_failed_operations(graph_id: str = None, datastore_ns: str = None):
         # this is usually "/root/.cloudvolume/secrets/<some_secret>.json"
         client = datastore.Client()
 
-    query = client.query(kind=f"{graph_id}_failed", namespace=datastore_ns)
+    # only the key and timestamp are needed, skip the rest of the entity
+    query = client.query(
+        kind=f"{graph_id}_failed", namespace=datastore_ns, projection=["timestamp"]
+    )
     cg = ChunkedGraph(graph_id=graph_id)
-    for log in query.fetch():
-        print(f"Re-trying operation ID {log.id}")
-        _repair_operation(cg, log)
-        client.delete(log.key)
+    logs = list(query.fetch())
+
+    # operations are replayed at their original timestamps without root locks
+    # (privileged mode), those touching the same segments must run in order
+    # so only groups of operations with disjoint roots are repaired concurrently
+    logs = sorted(logs, key=lambda log: (_get_timestamp(log), log.id))
+    operations = []
+    for log in logs:
+        operation = GraphEditOperation.from_operation_id(
+            cg, log.id, multicut_as_split=False, privileged_mode=True
+        )
+        operations.append(operation)
+    roots = [
+        _get_operation_roots(cg, operation, _get_timestamp(log))
+        for log, operation in zip(logs, operations)
+    ]
+
+    def _repair_group(group):
+        repaired_ = []
+        for i in group:
+            log = logs[i]
+            print(f"Re-trying operation ID {log.id}")
+            try:
+                _repair_operation(cg, operations[i], log.id, _get_timestamp(log))
+            except Exception as err:  # pylint: disable=broad-except
+                # later operations on these segments depend on this one
+                # leave them in datastore to be retried later
+                print(f"Failed to repair operation ID {log.id}: {err}")
+                break
+            repaired_.append(log.key)
+        return repaired_
+
+    # repairs are mostly waiting on bigtable, overlap independent groups
+    # keep this low to avoid hitting bigtable quotas
+    max_workers = int(environ.get("REPAIR_MAX_WORKERS", 8))
+    repaired = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for result in executor.map(_repair_group, _group_by_roots(roots)):
+            repaired.extend(result)
+
+    _delete_keys(client, repaired)
 
 
 def repair_operations():
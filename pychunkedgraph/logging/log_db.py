@@ -18,13 +18,22 @@ EXCLUDE_FROM_INDEX = os.environ.get(
 )
 EXCLUDE_FROM_INDEX = tuple(attr.strip() for attr in EXCLUDE_FROM_INDEX.split(","))
 
+# datastore allows at most 500 entities per commit
+LOG_BATCH_SIZE = min(int(os.environ.get("PCG_SERVER_LOGS_BATCH_SIZE", 500)), 500)
+LOG_BATCH_WINDOW = 0.05
+# bounds memory if writes fall behind, oldest logs are dropped when full
+LOG_QUEUE_MAX = int(os.environ.get("PCG_SERVER_LOGS_QUEUE_MAX", 10000))
+
 
 class LogDB:
     def __init__(self, graph_id: str, client: DatastoreFlex):
         self._graph_id = graph_id
         self._client = client
         self._kind = f"server_logs_{self._graph_id}"
-        self._q = queue.Queue()
+        self._q = queue.Queue(maxsize=LOG_QUEUE_MAX)
+        self.dropped = 0
+        # incomplete key shared by all entities, put assigns each a new complete key
+        self._partial_key = client.key(self._kind, namespace=client.namespace)
 
     @property
     def graph_id(self):
@@ -54,7 +63,7 @@ class LogDB:
         }
         if operation_id is not None:
             item["operation_id"] = int(operation_id)
-        self._q.put(item)
+        self._put(item)
 
     def log_code_block(self, name: str, operation_id, timestamp, time_ms, **kwargs):
         item = {
@@ -64,20 +73,52 @@ class LogDB:
             "time_ms": time_ms,
         }
         item.update(kwargs)
-        self._q.put(item)
+        self._put(item)
+
+    def _put(self, item: dict):
+        # never block the request, logging is best effort
+        try:
+            self._q.put_nowait(item)
+            return
+        except queue.Full:
+            ...
+        try:
+            self._q.get_nowait()
+            self.dropped += 1
+            self._q.put_nowait(item)
+        except (queue.Empty, queue.Full):
+            self.dropped += 1
+
+    def _get_batch(self) -> list:
+        # blocks until an item is available, no polling
+        items = [self._q.get()]
+        # items logged within a short window are written together
+        deadline = time.monotonic() + LOG_BATCH_WINDOW
+        while len(items) < LOG_BATCH_SIZE:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                items.append(self._q.get(timeout=timeout))
+            except queue.Empty:
+                break
+        return items
 
     def log_entity(self):
         while True:
+            items = self._get_batch()
             try:
-                item = self._q.get_nowait()
-                key = self.client.key(self._kind, namespace=self._client.namespace)
-                entity = self.client.entity(
-                    key, exclude_from_indexes=EXCLUDE_FROM_INDEX
-                )
-                entity.update(item)
-                self.client.put(entity)
-            except queue.Empty:
-                time.sleep(1)
+                entities = []
+                new_entity = self.client.entity
+                key = self._partial_key
+                for item in items:
+                    entity = new_entity(key, exclude_from_indexes=EXCLUDE_FROM_INDEX)
+                    entity.update(item)
+                    entities.append(entity)
+                self.client.put_multi(entities)
+            except GoogleAPIError:
+                # logging is best effort, keep the thread alive
+                ...
 
 
 def get_log_db(graph_id: str) -> LogDB:
@@ -115,13 +156,14 @@ class TimeIt:
             self.operation_id = operation_id
 
     def __enter__(self):
-        self._start = time.time()
+        # monotonic, unaffected by system clock adjustments
+        self._start = time.perf_counter_ns()
 
     def __exit__(self, *args):
         if ENABLE_LOGS is False:
             return
 
-        time_ms = (time.time() - self._start) * 1000
+        time_ms = (time.perf_counter_ns() - self._start) / 1e6
         try:
             log_db = get_log_db(self._graph_id)
             log_db.log_code_block(
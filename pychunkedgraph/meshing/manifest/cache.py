@@ -26,6 +26,19 @@ except Exception:
     REDIS = None
 
 
+def _get_decoded(keys: List[str]) -> List[Optional[str]]:
+    """
+    Values of `keys` with a single MGET, None for missing keys.
+    Values are decoded together with one join and split, they have no newlines.
+    """
+    if not keys:
+        return []
+    values = REDIS.mget(keys)
+    cached = [v for v in values if v is not None]
+    decoded = iter(b"\n".join(cached).decode().split("\n"))
+    return [None if v is None else next(decoded) for v in values]
+
+
 class ManifestCache:
     def __init__(self, namespace: str, initial: Optional[bool] = True) -> None:
         self._initial = initial
@@ -78,19 +91,14 @@ class ManifestCache:
         if REDIS is None:
             return {}, node_ids, []
 
-        pipeline = REDIS.pipeline()
-        for node_id in node_ids:
-            pipeline.get(f"{self.namespace}:{node_id}")
-
         result = {}
         not_cached = []
         not_existing = []
-        fragments = pipeline.execute()
+        fragments = _get_decoded([f"{self.namespace}:{n}" for n in node_ids])
         for node_id, fragment in zip(node_ids, fragments):
             if fragment is None:
                 not_cached.append(node_id)
                 continue
-            fragment = fragment.decode()
             try:
                 path, offset, size = fragment.split(":")
                 result[node_id] = [path, int(offset), int(size)]
@@ -102,19 +110,14 @@ class ManifestCache:
         if REDIS is None:
             return {}, node_ids, []
 
-        pipeline = REDIS.pipeline()
-        for node_id in node_ids:
-            pipeline.get(f"{self.namespace}:{node_id}")
-
         result = {}
         not_cached = []
         not_existing = []
-        fragments = pipeline.execute()
+        fragments = _get_decoded([f"{self.namespace}:{n}" for n in node_ids])
         for node_id, fragment in zip(node_ids, fragments):
             if fragment is None:
                 not_cached.append(node_id)
                 continue
-            fragment = fragment.decode()
             if fragment == DOES_NOT_EXIST:
                 not_existing.append(node_id)
             else:
@@ -385,15 +385,17 @@ def get_lx_overlapping_remappings(cg, chunk_id, time_stamp=None, n_threads=1):
         sv_ids.extend(neigh_lx_id_remap[lx_id])
         lx_ids_flat.extend([lx_id] * len(neigh_lx_id_remap[lx_id]))
 
+    # membership per lx id, instead of an np.in1d and array scans per root
+    unsafe_lx_ids_set = set(unsafe_lx_ids)
     unsafe_dict = collections.defaultdict(list)
     for root_id in unsafe_root_ids:
-        if np.sum(~np.in1d(root_lx_dict[root_id], unsafe_lx_ids)) == 0:
+        if all(lx_id in unsafe_lx_ids_set for lx_id in root_lx_dict[root_id]):
             continue
 
         for neigh_lx_id in root_lx_dict[root_id]:
             unsafe_dict[root_id].append(neigh_lx_id)
 
-            if neigh_lx_id in unsafe_lx_ids:
+            if neigh_lx_id in unsafe_lx_ids_set:
                 continue
 
             sv_ids.extend(neigh_lx_id_remap[neigh_lx_id])
@@ -741,39 +743,30 @@ def merge_draco_meshes_across_boundaries(
         )
         # Separate the vertices that are on the quantized chunk boundary from those that aren't
         are_chunk_aligned = (vertices == quantized_chunk_boundary).any(axis=1)
-        vertices = np.hstack((vertices, np.arange(vertexct[-1])[:, np.newaxis]))
-        chunk_aligned = vertices[are_chunk_aligned]
-        not_chunk_aligned = vertices[~are_chunk_aligned]
-        del vertices
+        chunk_aligned_ids = np.flatnonzero(are_chunk_aligned)
+        not_chunk_aligned_ids = np.flatnonzero(~are_chunk_aligned)
         del are_chunk_aligned
-        faces_remapping = {}
+        # old vertex index -> new vertex index, as an array instead of a dict
+        faces_remapping = np.empty(vertexct[-1], dtype=np.uint32)
         # Those that are not simply pass through (simple remap)
-        if len(not_chunk_aligned) > 0:
-            not_chunk_aligned_remap = dict(
-                zip(
-                    not_chunk_aligned[:, 3].astype(np.uint32),
-                    np.arange(len(not_chunk_aligned), dtype=np.uint32),
-                )
-            )
-            faces_remapping.update(not_chunk_aligned_remap)
+        faces_remapping[not_chunk_aligned_ids] = np.arange(
+            len(not_chunk_aligned_ids), dtype=np.uint32
+        )
         # Those that are on the boundary we remove duplicates
-        if len(chunk_aligned) > 0:
+        if len(chunk_aligned_ids) > 0:
             unique_chunk_aligned, inverse_to_chunk_aligned = np.unique(
-                chunk_aligned[:, 0:3], return_inverse=True, axis=0
+                vertices[chunk_aligned_ids], return_inverse=True, axis=0
             )
-            chunk_aligned_remap = dict(
-                zip(
-                    chunk_aligned[:, 3].astype(np.uint32),
-                    np.uint32(len(not_chunk_aligned))
-                    + inverse_to_chunk_aligned.astype(np.uint32),
-                )
+            faces_remapping[chunk_aligned_ids] = np.uint32(
+                len(not_chunk_aligned_ids)
+            ) + inverse_to_chunk_aligned.reshape(-1).astype(np.uint32)
+            vertices = np.concatenate(
+                (vertices[not_chunk_aligned_ids], unique_chunk_aligned)
             )
-            faces_remapping.update(chunk_aligned_remap)
-            vertices = np.concatenate((not_chunk_aligned[:, 0:3], unique_chunk_aligned))
         else:
-            vertices = not_chunk_aligned[:, 0:3]
+            vertices = vertices[not_chunk_aligned_ids]
         # Remap the faces to their new vertex indices
-        fastremap.remap(faces, faces_remapping, in_place=True)
+        faces[:] = faces_remapping[faces]
 
     if return_zmesh_object:
         return zmesh.Mesh(vertices[:, 0:3], faces.reshape(-1, 3), None)
@@ -806,11 +799,10 @@ def black_out_dust_from_segmentation(seg, dust_threshold):
         axis=None,
     )
     seg_ids_on_boundary = np.unique(boundary)
-    dust_segids = [
-        sid
-        for sid, ct in zip(seg_ids, voxel_count)
-        if ct < int(dust_threshold) and np.isin(sid, seg_ids_on_boundary, invert=True)
-    ]
+    # one isin over all ids instead of one per id
+    dust_mask = voxel_count < int(dust_threshold)
+    dust_mask &= np.isin(seg_ids, seg_ids_on_boundary, invert=True)
+    dust_segids = seg_ids[dust_mask].tolist()
     seg = fastremap.mask(seg, dust_segids, in_place=True)
 
 
@@ -833,7 +825,7 @@ def remeshing(
     perform remeshing and stitching up the node hierarchy (or up to the stop_layer)
 
     :param cg: chunkedgraph instance
-    :param l2_node_ids: list of uint64
+    :param l2_node_ids: np.ndarray of uint64, other sequences are converted
     :param stop_layer: int
     :param cv_path: str
     :param cv_mesh_dir: str
@@ -842,14 +834,12 @@ def remeshing(
     :return:
     """
     l2_chunk_dict = collections.defaultdict(set)
-    # Find the chunk_ids of the l2_node_ids
-
-    def add_nodes_to_l2_chunk_dict(ids):
-        for node_id in ids:
-            chunk_id = cg.get_chunk_id(node_id)
-            l2_chunk_dict[chunk_id].add(node_id)
-
-    add_nodes_to_l2_chunk_dict(l2_node_ids)
+    # Find the chunk_ids of the l2_node_ids, all at once
+    # no copy for uint64 arrays, duplicates are dropped by the per chunk sets
+    l2_node_ids = np.asarray(l2_node_ids, dtype=np.uint64)
+    l2_chunk_ids = cg.get_chunk_ids_from_node_ids(l2_node_ids)
+    for chunk_id, node_id in zip(l2_chunk_ids, l2_node_ids):
+        l2_chunk_dict[chunk_id].add(node_id)
     for chunk_id, node_ids in l2_chunk_dict.items():
         if PRINT_FOR_DEBUGGING:
             print("remeshing", chunk_id, node_ids)
@@ -1249,10 +1239,14 @@ def chunk_initial_sharded_stitching_task(
     layer = cg.get_chunk_layer(chunk_id)
     multi_child_nodes, multi_child_descendants = get_multi_child_nodes(cg, chunk_id)
 
-    chunk_to_id_dict = collections.defaultdict(list)
-    for child_node in multi_child_descendants:
-        cur_chunk_id = int(cg.get_chunk_id(child_node))
-        chunk_to_id_dict[cur_chunk_id].append(child_node)
+    # group descendants by chunk with a sort instead of a dict append per node
+    descendants = np.asarray(multi_child_descendants, dtype=np.uint64)
+    descendants_chunk_ids = cg.get_chunk_ids_from_node_ids(descendants)
+    order = np.argsort(descendants_chunk_ids, kind="stable")
+    u_chunk_ids, starts = np.unique(descendants_chunk_ids[order], return_index=True)
+    chunk_to_id_dict = dict(
+        zip(u_chunk_ids.tolist(), np.split(descendants[order], starts[1:]))
+    )
 
     cv = CloudVolume(
         f"graphene://https://localhost/segmentation/table/dummy",
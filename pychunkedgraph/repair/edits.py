@@ -27,9 +27,8 @@ def repair_operation(cg, log_d, operation_id):
     print("result op ID", result.operation_id)
     print("result L2 IDs", result.new_lvl2_ids)
 
-    for root_ in old_roots:
-        cg.client.unlock_root(root_, result.operation_id)
-        cg.client.unlock_indefinitely_locked_root(root_, result.operation_id)
+    cg.client.unlock_roots(old_roots, result.operation_id)
+    cg.client.unlock_indefinitely_locked_roots(old_roots, result.operation_id)
 
 
 if __name__ == "__main__":
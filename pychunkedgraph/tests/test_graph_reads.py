@@ -0,0 +1,410 @@
+"""
+Read paths of ChunkedGraph on a small in-memory hierarchy,
+compared with the node by node implementations they replaced.
+"""
+
+from types import SimpleNamespace
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from ..graph import attributes
+from ..graph import types
+from ..graph import exceptions
+from ..graph import chunkedgraph
+from ..graph.meta import DataSource
+from ..graph.meta import GraphConfig
+from ..graph.meta import ChunkedGraphMeta
+from ..graph.chunks import utils as chunk_utils
+from ..graph.utils import basetypes
+
+Cell = namedtuple("Cell", ("value", "timestamp"))
+
+
+class FakeClient:
+    """Parent, child and cross edge rows, read like `BigTableClient` reads them."""
+
+    def __init__(self):
+        self.parents = {}
+        self.children = {}
+        self.cross_edges = {}
+
+    def link(self, parent, children):
+        self.children[int(parent)] = np.array(children, dtype=basetypes.NODE_ID)
+        for child in children:
+            self.parents[int(child)] = parent
+
+    def _read(self, node_id, prop):
+        if prop == attributes.Hierarchy.Parent:
+            value = self.parents.get(int(node_id))
+        elif prop == attributes.Hierarchy.Child:
+            value = self.children.get(int(node_id))
+        else:
+            value = self.cross_edges.get(int(node_id), {}).get(prop.index)
+        return None if value is None else [Cell(value, None)]
+
+    def read_node(self, node_id, properties=None, **_):
+        return self._read(node_id, properties) or []
+
+    def read_nodes(self, node_ids=None, properties=None, **_):
+        result = {}
+        for node_id in node_ids:
+            if isinstance(properties, list):
+                cells = {p: self._read(node_id, p) for p in properties}
+                cells = {p: v for p, v in cells.items() if v is not None}
+            else:
+                cells = self._read(node_id, properties)
+            if cells:
+                result[node_id] = cells
+        return result
+
+
+@pytest.fixture
+def graph(monkeypatch):
+    """
+    Five layers, fanout 2, 4 x 4 x 4 level 2 chunks.
+    A: svs -> a2_0, a2_1, a2_in (L3 chunk 0), a2_2 (L3 chunk 1) -> a4 -> rA,
+       a2_in is in the interior of the L4 chunk.
+    B: svs -> b2 -> b4 -> rB, skips layer 3.
+    C: svs -> c2 -> c3, no parent above layer 3.
+    """
+    n_layers = 5
+    meta = ChunkedGraphMeta(
+        GraphConfig(ID="test", CHUNK_SIZE=[64, 64, 64], FANOUT=2), DataSource()
+    )
+    meta.layer_count = n_layers
+    meta.layer_chunk_bounds = {
+        layer: np.array([2 ** (n_layers - 1 - layer)] * 3)
+        for layer in range(2, n_layers)
+    }
+    client = FakeClient()
+    monkeypatch.setattr(chunkedgraph, "BigTableClient", lambda *_, **__: client)
+    cg = chunkedgraph.ChunkedGraph(meta=meta, client_info=SimpleNamespace(CONFIG=None))
+
+    def node(layer, x, y, z, segment=1):
+        return cg.get_node_id(np.uint64(segment), layer=layer, x=x, y=y, z=z)
+
+    def l2_node(x, y, z):
+        l2_id = node(2, x, y, z)
+        client.link(l2_id, [node(1, x, y, z, 1), node(1, x, y, z, 2)])
+        return l2_id
+
+    g = SimpleNamespace(cg=cg, client=client)
+    g.rA, g.a4 = node(5, 0, 0, 0), node(4, 0, 0, 0)
+    g.a3_0, g.a3_1 = node(3, 0, 0, 0), node(3, 1, 0, 0)
+    g.a2_0, g.a2_1 = l2_node(0, 0, 0), l2_node(1, 0, 0)
+    g.a2_in, g.a2_2 = l2_node(1, 1, 1), l2_node(2, 0, 0)
+    client.link(g.rA, [g.a4])
+    client.link(g.a4, [g.a3_0, g.a3_1])
+    client.link(g.a3_0, [g.a2_0, g.a2_1, g.a2_in])
+    client.link(g.a3_1, [g.a2_2])
+
+    g.rB, g.b4, g.b2 = node(5, 0, 0, 0, 2), node(4, 0, 0, 0, 2), l2_node(3, 3, 3)
+    client.link(g.rB, [g.b4])
+    client.link(g.b4, [g.b2])
+
+    g.c3, g.c2 = node(3, 0, 1, 0), l2_node(0, 2, 0)
+    client.link(g.c3, [g.c2])
+
+    g.svs = {
+        l2_id: client.children[int(l2_id)]
+        for l2_id in [g.a2_0, g.a2_1, g.a2_in, g.a2_2, g.b2, g.c2]
+    }
+    return g
+
+
+class TestGetRoots:
+    @pytest.fixture
+    def executors(self, monkeypatch):
+        """Executors created by `get_roots` and futures submitted to them."""
+        created = SimpleNamespace(executors=[], futures=[])
+
+        class _Executor(ThreadPoolExecutor):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                created.executors.append(self)
+
+            def submit(self, *args, **kwargs):
+                future = super().submit(*args, **kwargs)
+                created.futures.append(future)
+                return future
+
+        monkeypatch.setattr(chunkedgraph, "ThreadPoolExecutor", _Executor)
+        return created
+
+    @pytest.mark.timeout(30)
+    @pytest.mark.parametrize("prefetch", [True, False])
+    def test_roots(self, graph, executors, monkeypatch, prefetch):
+        monkeypatch.setattr(chunkedgraph, "_PREFETCH_MIN_IDS", 0 if prefetch else 100)
+        svs = np.concatenate([graph.svs[graph.a2_0], graph.svs[graph.a2_2]])
+        node_ids = np.concatenate(
+            [svs, svs, graph.svs[graph.b2], np.zeros(1, dtype=basetypes.NODE_ID)]
+        )
+        roots = graph.cg.get_roots(node_ids)
+        assert np.all(roots[: 2 * len(svs)] == graph.rA)
+        assert np.all(roots[2 * len(svs) : -1] == graph.rB)
+        assert roots[-1] == 0
+
+        assert len(executors.executors) == int(prefetch)
+        assert len(executors.futures) == (3 if prefetch else 0)
+        # pending reads are awaited before returning
+        assert all(future.done() for future in executors.futures)
+
+        roots = graph.cg.get_roots(node_ids[:-1], assert_roots=True)
+        assert np.all(roots[: 2 * len(svs)] == graph.rA)
+
+    @pytest.mark.timeout(30)
+    def test_cross_chunk_parents(self, graph):
+        # children of a4 are in different layer 3 chunks
+        node_ids = np.array(
+            [
+                graph.svs[graph.a2_0][0],
+                graph.svs[graph.a2_in][1],
+                graph.svs[graph.a2_2][0],
+                graph.a2_1,
+                graph.a3_1,
+                graph.a4,
+                graph.rA,
+            ],
+            dtype=basetypes.NODE_ID,
+        )
+        assert np.all(graph.cg.get_roots(node_ids) == graph.rA)
+        assert np.all(graph.cg.get_roots(node_ids[:3], stop_layer=4) == graph.a4)
+        expected = [graph.a3_0, graph.a3_0, graph.a3_1, graph.a3_0, graph.a3_1]
+        assert np.all(graph.cg.get_roots(node_ids[:5], stop_layer=3) == expected)
+
+    @pytest.mark.timeout(30)
+    def test_stop_layer(self, graph):
+        svs = np.concatenate([graph.svs[graph.a2_0], graph.svs[graph.b2]])
+        expected = [graph.a2_0] * 2 + [graph.b2] * 2
+        assert np.all(graph.cg.get_roots(svs, stop_layer=2) == expected)
+
+        # b2 has no parent at layer 3, ceil returns the one above
+        expected = [graph.a3_0] * 2 + [graph.b4] * 2
+        assert np.all(graph.cg.get_roots(svs, stop_layer=3) == expected)
+        expected = [graph.a3_0] * 2 + [graph.b2] * 2
+        assert np.all(graph.cg.get_roots(svs, stop_layer=3, ceil=False) == expected)
+
+    @pytest.mark.timeout(30)
+    def test_fail_to_zero(self, graph):
+        unknown = graph.cg.get_node_id(np.uint64(9), layer=1, x=3, y=0, z=0)
+        node_ids = np.array([graph.svs[graph.a2_0][0], unknown], basetypes.NODE_ID)
+        roots = graph.cg.get_roots(node_ids, fail_to_zero=True)
+        assert np.all(roots == [graph.rA, 0])
+        with pytest.raises(KeyError):
+            graph.cg.get_roots(node_ids)
+
+    @pytest.mark.timeout(30)
+    def test_missing_root(self, graph):
+        node_ids = graph.svs[graph.c2]
+        assert np.all(graph.cg.get_roots(node_ids) == graph.c3)
+        with pytest.raises(AssertionError):
+            graph.cg.get_roots(node_ids, assert_roots=True)
+
+
+class TestGetAllParentsDict:
+    @pytest.mark.timeout(30)
+    def test_parents(self, graph):
+        sv_a, sv_b = graph.svs[graph.a2_0][0], graph.svs[graph.b2][1]
+        result = graph.cg.get_all_parents_dict_multiple([sv_a, sv_a, sv_b])
+        assert len(result) == 2
+        assert result[sv_a] == {2: graph.a2_0, 3: graph.a3_0, 4: graph.a4, 5: graph.rA}
+        # no parent at layer 3
+        assert result[sv_b] == {2: graph.b2, 4: graph.b4, 5: graph.rB}
+
+        for sv in [sv_a, sv_b]:
+            assert graph.cg.get_all_parents_dict(sv) == result[sv]
+            parents = graph.cg.get_root(sv, get_all_parents=True)
+            assert list(parents) == [result[sv][l] for l in sorted(result[sv])]
+
+    @pytest.mark.timeout(30)
+    def test_mixed_layers(self, graph):
+        node_ids = [graph.svs[graph.a2_2][0], graph.a2_2, graph.a3_1, graph.rA]
+        result = graph.cg.get_all_parents_dict_multiple(node_ids)
+        assert result[node_ids[0]] == {
+            2: graph.a2_2,
+            3: graph.a3_1,
+            4: graph.a4,
+            5: graph.rA,
+        }
+        assert result[graph.a2_2] == {3: graph.a3_1, 4: graph.a4, 5: graph.rA}
+        assert result[graph.a3_1] == {4: graph.a4, 5: graph.rA}
+        assert result[graph.rA] == {}
+
+    @pytest.mark.timeout(30)
+    def test_stop_layer(self, graph):
+        sv_a, sv_b = graph.svs[graph.a2_0][0], graph.svs[graph.b2][1]
+        result = graph.cg.get_all_parents_dict_multiple([sv_a, sv_b], stop_layer=3)
+        assert result[sv_a] == {2: graph.a2_0, 3: graph.a3_0}
+        # walk stops at the first parent at or above `stop_layer`
+        assert result[sv_b] == {2: graph.b2, 4: graph.b4}
+
+    @pytest.mark.timeout(30)
+    def test_strict(self, graph):
+        sv_a, sv_c = graph.svs[graph.a2_0][0], graph.svs[graph.c2][0]
+        result = graph.cg.get_all_parents_dict_multiple([sv_a, sv_c])
+        assert result[sv_c] == {2: graph.c2, 3: graph.c3}
+
+        result = graph.cg.get_all_parents_dict_multiple([sv_a], strict=True)
+        assert result[sv_a][5] == graph.rA
+        with pytest.raises(exceptions.ChunkedGraphError):
+            graph.cg.get_all_parents_dict_multiple([sv_a, sv_c], strict=True)
+        with pytest.raises(exceptions.ChunkedGraphError):
+            graph.cg.get_all_parents_dict(sv_c)
+        # parents up to layer 3 exist
+        result = graph.cg.get_all_parents_dict_multiple(
+            [sv_c], stop_layer=3, strict=True
+        )
+        assert result[sv_c] == {2: graph.c2, 3: graph.c3}
+
+
+def _bounding_l2_children(cg, parents) -> dict:
+    """Parent by parent, as before the array version."""
+    parent_chunk_ids = cg.get_chunk_ids_from_node_ids(parents)
+    chunk_id_bchunk_ids_d = cg._get_bounding_chunk_ids(parent_chunk_ids)
+    result = {}
+    for parent, chunk_id in zip(parents, parent_chunk_ids):
+        descendants = np.array([parent], dtype=basetypes.NODE_ID)
+        layers = cg.get_chunk_layers(descendants)
+        while np.any(layers > 2):
+            children = [descendants[layers == 2]]
+            children.extend(cg.get_children(id_) for id_ in descendants[layers > 2])
+            descendants = np.concatenate(children)
+            chunk_ids = cg.get_chunk_ids_from_node_ids(descendants)
+            mask = np.in1d(chunk_ids, chunk_id_bchunk_ids_d[chunk_id])
+            descendants = descendants[mask]
+            layers = cg.get_chunk_layers(descendants)
+        result[parent] = descendants
+    return result
+
+
+class TestBoundingL2Children:
+    @pytest.mark.timeout(30)
+    def test_bounding_l2_children(self, graph):
+        for parents in [
+            [graph.a3_0, graph.a3_1, graph.c3],
+            [graph.a4, graph.b4, graph.a4],
+            [graph.rA, graph.rB],
+        ]:
+            result = graph.cg._get_bounding_l2_children(parents)
+            expected = _bounding_l2_children(graph.cg, parents)
+            assert result.keys() == expected.keys()
+            for parent, l2ids in expected.items():
+                assert np.array_equal(np.sort(result[parent]), np.sort(l2ids))
+
+        result = graph.cg._get_bounding_l2_children([graph.a3_0, graph.a4])
+        # every layer 2 chunk of a layer 3 chunk is on its boundary
+        assert graph.a2_in in result[graph.a3_0]
+        assert graph.a2_in not in result[graph.a4]
+        assert set(result[graph.a4]) == {graph.a2_0, graph.a2_1, graph.a2_2}
+
+
+def _bounding_chunk_ids(cg, chunk_id, unique: bool) -> np.ndarray:
+    """Chunk by chunk, as before the array version."""
+    layer = cg.get_chunk_layer(chunk_id)
+    coords = cg.get_chunk_coordinates(chunk_id)
+    chunk_ids = [np.array([], dtype=basetypes.NODE_ID)]
+    for child_layer in range(2, layer):
+        bcoords = chunk_utils.get_bounding_children_chunks(
+            cg.meta, layer, coords, child_layer, return_unique=False
+        )
+        chunk_ids.append(
+            chunk_utils.get_chunk_ids_from_coords(cg.meta, child_layer, bcoords)
+        )
+    chunk_ids = np.concatenate(chunk_ids)
+    return np.unique(chunk_ids) if unique else chunk_ids
+
+
+class TestBoundingChunkIds:
+    @pytest.mark.timeout(30)
+    @pytest.mark.parametrize("unique", [True, False])
+    def test_bounding_chunk_ids(self, graph, unique):
+        cg = graph.cg
+        for layer in range(3, cg.meta.layer_count + 1):
+            bounds = cg.meta.layer_chunk_bounds.get(layer, [1, 1, 1])
+            chunk_ids = [
+                cg.get_chunk_id(layer=layer, x=x, y=y, z=z)
+                for x, y, z in np.ndindex(*bounds)
+            ]
+            # second call is served from the cache
+            for _ in range(2):
+                result = cg._get_bounding_chunk_ids(chunk_ids + chunk_ids[:1], unique)
+                assert result.keys() == set(chunk_ids)
+                for chunk_id in chunk_ids:
+                    expected = _bounding_chunk_ids(cg, chunk_id, unique)
+                    if unique:
+                        assert np.array_equal(result[chunk_id], expected)
+                    else:
+                        assert np.array_equal(
+                            np.sort(result[chunk_id]), np.sort(expected)
+                        )
+                    assert not result[chunk_id].flags.writeable
+
+
+def _min_layer_cross_edges(meta, l2_edges_ds, node_layer: int):
+    """Level 2 ID by level 2 ID, as before the array version."""
+    min_layer = meta.layer_count
+    for edges_d in l2_edges_ds:
+        for layer in range(node_layer, meta.layer_count):
+            if edges_d.get(layer, types.empty_2d).size:
+                min_layer = min(min_layer, layer)
+                break
+    edges = [types.empty_2d]
+    for edges_d in l2_edges_ds:
+        edges.append(edges_d.get(min_layer, types.empty_2d))
+    return min_layer, np.concatenate(edges)
+
+
+class TestMinLayerCrossEdges:
+    def _set_cross_edges(self, graph, seed: int):
+        rng = np.random.default_rng(seed)
+        l2ids = [graph.a2_0, graph.a2_1, graph.a2_in, graph.a2_2, graph.b2, graph.c2]
+        for l2id in l2ids:
+            edges_d = {}
+            for layer in range(2, graph.cg.meta.layer_count):
+                # empty arrays too, they don't count for the min layer
+                n_edges = rng.integers(0, 3)
+                if rng.random() < 0.5:
+                    edges = rng.integers(1, 100, size=(n_edges, 2))
+                    edges_d[layer] = edges.astype(basetypes.NODE_ID)
+            graph.client.cross_edges[int(l2id)] = edges_d
+
+    @pytest.mark.timeout(30)
+    @pytest.mark.parametrize("seed", range(10))
+    def test_min_layer_cross_edges_multiple(self, graph, seed):
+        self._set_cross_edges(graph, seed)
+        cg = graph.cg
+        node_ids = np.array(
+            [graph.a3_0, graph.a3_1, graph.c3, graph.a4, graph.b4, graph.rA],
+            dtype=basetypes.NODE_ID,
+        )
+        node_layers = cg.get_chunk_layers(node_ids)
+        node_l2ids_d = {}
+        for layer in np.unique(node_layers):
+            node_l2ids_d.update(
+                cg._get_bounding_l2_children(node_ids[node_layers == layer])
+            )
+        l2_edges_d_d = cg.get_atomic_cross_edges(
+            np.concatenate(list(node_l2ids_d.values()))
+        )
+
+        min_layers, node_edges = cg._get_min_layer_cross_edges_multiple(
+            node_ids, node_layers, node_l2ids_d, l2_edges_d_d
+        )
+        for i, node_id in enumerate(node_ids):
+            l2_edges_ds = [l2_edges_d_d[l2id] for l2id in node_l2ids_d[node_id]]
+            min_layer, edges = _min_layer_cross_edges(
+                cg.meta, l2_edges_ds, node_layers[i]
+            )
+            assert min_layers[i] == min_layer
+            assert np.array_equal(node_edges[i], edges)
+
+        result = cg.get_cross_chunk_edges(node_ids, uplift=False)
+        for i, node_id in enumerate(node_ids):
+            if min_layers[i] > node_layers[i]:
+                assert list(result[node_id]) == [node_layers[i]]
+                assert result[node_id][node_layers[i]].shape == (0, 2)
+            else:
+                assert np.array_equal(result[node_id][min_layers[i]], node_edges[i])
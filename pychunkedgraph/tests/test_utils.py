@@ -0,0 +1,290 @@
+import pickle
+from copy import deepcopy
+from types import SimpleNamespace
+from datetime import datetime
+from datetime import timezone
+
+import numpy as np
+import pytest
+
+from ..graph import attributes
+from ..graph.types import Agglomeration
+from ..graph.meta import DataSource
+from ..graph.meta import GraphConfig
+from ..graph.meta import ChunkedGraphMeta
+from ..graph.chunks.hierarchy import get_children_chunk_count
+from ..graph.chunks.hierarchy import get_children_chunk_coords
+from ..graph.edges.utils import _get_cross_chunk_edges_layer
+from ..graph.utils import basetypes
+from ..export.models import LogStatus
+from ..export.models import MergeLog
+from ..export.models import SplitLog
+from ..export.models import build_operation_logs
+from ..ingest.create.writer import RowWriter
+from ..jobs.repair.main import _delete_keys
+from ..jobs.repair.main import _group_by_roots
+from ..utils.general import unique_1d
+from ..utils.general import unique_rows
+
+
+def _get_meta(fanout: int, n_layers: int, atomic_bounds) -> ChunkedGraphMeta:
+    meta = ChunkedGraphMeta(
+        GraphConfig(CHUNK_SIZE=[512, 512, 64], FANOUT=fanout), DataSource()
+    )
+    meta.layer_count = n_layers
+    atomic_bounds = np.array(atomic_bounds, dtype=int)
+    meta.layer_chunk_bounds = {
+        layer: -(-atomic_bounds // fanout ** (layer - 2))
+        for layer in range(2, n_layers)
+    }
+    return meta
+
+
+def _cross_chunk_edges_layer(meta: ChunkedGraphMeta, coords: np.ndarray):
+    """Edge by edge, as before the array version."""
+    fanout = meta.graph_config.FANOUT
+    result = []
+    for coords0, coords1 in coords:
+        layer = 1
+        for _ in range(2, meta.layer_count):
+            if np.all(coords0 == coords1):
+                break
+            layer += 1
+            coords0 = coords0 // fanout
+            coords1 = coords1 // fanout
+        result.append(layer)
+    return np.array(result, dtype=int)
+
+
+class TestUnique:
+    @pytest.mark.timeout(30)
+    def test_unique_rows(self):
+        rng = np.random.default_rng(0)
+        for n in [0, 1, 2, 100, 5000]:
+            arr = rng.integers(0, 20, size=(n, 2)).astype(np.uint64)
+            expected = np.unique(arr, axis=0).reshape(-1, 2)
+            assert np.array_equal(unique_rows(arr), expected)
+
+        # large IDs, differing only in the low bits
+        arr = np.array([[2**63 + 1, 5], [2**63, 5], [2**63 + 1, 5]], np.uint64)
+        assert np.array_equal(unique_rows(arr), np.unique(arr, axis=0))
+
+    @pytest.mark.timeout(30)
+    def test_unique_1d(self):
+        rng = np.random.default_rng(0)
+        for n in [0, 1, 2, 100, 5000]:
+            arr = rng.integers(0, 50, size=n).astype(np.uint64)
+            assert np.array_equal(unique_1d(arr), np.unique(arr))
+            # sorted input takes the path without a sort
+            arr = np.sort(arr)
+            assert np.array_equal(unique_1d(arr), np.unique(arr))
+
+        arr = np.array([7], dtype=np.uint64)
+        result = unique_1d(arr)
+        result[0] = 0
+        assert arr[0] == 7, "input must not be returned as is"
+
+
+class TestCrossChunkEdgesLayer:
+    @pytest.mark.timeout(30)
+    @pytest.mark.parametrize("fanout", [2, 3, 4])
+    def test_layers(self, fanout):
+        n_layers = 8
+        meta = _get_meta(fanout, n_layers, [40, 40, 40])
+        rng = np.random.default_rng(fanout)
+        coords = rng.integers(0, 40, size=(2000, 2, 3))
+        # neighbouring chunks, common for cross chunk edges
+        coords[1000:, 1] = coords[1000:, 0]
+        coords[1000:, 1, rng.integers(0, 3, 1000)] += 1
+        # same chunk
+        coords[:10, 1] = coords[:10, 0]
+
+        result = _get_cross_chunk_edges_layer(meta, coords)
+        assert np.array_equal(result, _cross_chunk_edges_layer(meta, coords))
+        assert np.all(result[:10] == 1)
+        assert result.max() <= n_layers - 1
+
+
+class TestChildrenChunkCount:
+    @pytest.mark.timeout(30)
+    @pytest.mark.parametrize("fanout", [2, 3])
+    def test_count(self, fanout):
+        n_layers = 6
+        meta = _get_meta(fanout, n_layers, [13, 7, 5])
+        for layer in range(3, n_layers):
+            bounds = meta.layer_chunk_bounds[layer]
+            # includes coordinates at and past the dataset boundary
+            for coords in np.ndindex(*(bounds + 1)):
+                count = get_children_chunk_count(meta, layer, coords)
+                assert count == len(get_children_chunk_coords(meta, layer, coords))
+
+
+class TestSerializers:
+    @pytest.mark.timeout(30)
+    @pytest.mark.parametrize("n_edges", [0, 1, 100])
+    def test_compressed_array_round_trip(self, n_edges):
+        serializer = attributes.Connectivity.CrossChunkEdge[2].serializer
+        edges = np.arange(n_edges * 2, dtype=basetypes.NODE_ID).reshape(-1, 2)
+        result = serializer.deserialize(serializer.serialize(edges))
+        assert result.shape == (n_edges, 2)
+        assert np.array_equal(result, edges)
+
+    @pytest.mark.timeout(30)
+    def test_compressed_array_non_contiguous(self):
+        serializer = attributes.Connectivity.CrossChunkEdge[2].serializer
+        edges = np.arange(20, dtype=basetypes.NODE_ID).reshape(-1, 2)[::2]
+        result = serializer.deserialize(serializer.serialize(edges))
+        assert np.array_equal(result, edges)
+
+
+class TestAgglomeration:
+    @pytest.mark.timeout(30)
+    def test_pickle_and_deepcopy(self):
+        supervoxels = np.array([1, 2], dtype=basetypes.NODE_ID)
+        in_edges = np.array([[1, 2]], dtype=basetypes.NODE_ID)
+        for agg in [
+            Agglomeration(np.uint64(10)),
+            Agglomeration(np.uint64(10), supervoxels, in_edges, cross_edges_d={}),
+        ]:
+            for result in [pickle.loads(pickle.dumps(agg)), deepcopy(agg)]:
+                assert result.node_id == agg.node_id
+                assert np.array_equal(result.supervoxels, agg.supervoxels)
+                assert np.array_equal(result.in_edges, agg.in_edges)
+                assert result.cross_edges.shape == (0, 2)
+                assert result.cross_edges_d == agg.cross_edges_d
+
+
+class TestRowWriter:
+    def _get_cg(self, fail_at: int = None):
+        batches = []
+
+        def write(rows):
+            if fail_at is not None and len(batches) == fail_at:
+                raise ValueError("write failed")
+            batches.append(rows)
+
+        return SimpleNamespace(client=SimpleNamespace(write=write)), batches
+
+    @pytest.mark.timeout(30)
+    def test_writes_all_rows(self):
+        cg, batches = self._get_cg()
+        with RowWriter(cg, batch_size=10, max_pending=2) as writer:
+            for i in range(0, 95, 5):
+                writer.extend(range(i, i + 5))
+        assert writer.written == 95
+        assert all(len(rows) == 10 for rows in batches[:-1])
+        assert sorted(row for rows in batches for row in rows) == list(range(95))
+
+    @pytest.mark.timeout(30)
+    def test_no_rows(self):
+        cg, batches = self._get_cg()
+        with RowWriter(cg, batch_size=10) as writer:
+            writer.extend([])
+        assert writer.written == 0
+        assert not batches
+
+    @pytest.mark.timeout(30)
+    def test_write_error_is_raised(self):
+        cg, _ = self._get_cg(fail_at=1)
+        with pytest.raises(ValueError):
+            with RowWriter(cg, batch_size=10, max_pending=1) as writer:
+                for i in range(0, 100, 10):
+                    writer.extend(range(i, i + 10))
+
+
+class TestOperationLogs:
+    @pytest.mark.timeout(30)
+    def test_build_and_to_dict(self):
+        ts = datetime(2021, 5, 4, 3, 2, 1, 123456)
+        op_ts = datetime(2021, 5, 4, 3, 2, 0, 654321, tzinfo=timezone.utc)
+        merge = {
+            "id": 1,
+            "user": "user_a",
+            "timestamp": ts,
+            "status": 0,
+            "roots": [10],
+            "source_coords": [[1, 2, 3]],
+            "sink_coords": [[4, 5, 6]],
+            "added_edges": [[1, 2]],
+        }
+        split = {
+            "id": 2,
+            "user": "user_b",
+            "timestamp": ts,
+            "operation_ts": op_ts,
+            "status": 4,
+            "roots": [11, 12],
+            "source_coords": [[1, 2, 3]],
+            "sink_coords": [[4, 5, 6]],
+            "source_ids": [1],
+            "sink_ids": [3],
+            "bb_offset": [240, 240, 24],
+            "removed_edges": [[1, 3], [3, 4]],
+        }
+        merge_log, split_log = build_operation_logs([merge, split])
+        assert split_log.status == LogStatus.WRITE_FAILED
+
+        merge_d = merge_log.to_dict()
+        for k in ["id", "user", "status", "roots", "source_coords", "added_edges"]:
+            assert merge_d[k] == merge[k]
+        assert merge_d["timestamp"] == ts.replace(tzinfo=timezone.utc)
+        # missing operation timestamp falls back to the log timestamp
+        assert merge_d["operation_ts"] == merge_d["timestamp"]
+        assert merge_d["old_roots"] is None
+        assert merge_d["exception"] is None
+
+        split_d = split_log.to_dict()
+        for k in ["roots", "source_ids", "sink_ids", "bb_offset", "removed_edges"]:
+            assert split_d[k] == split[k]
+        assert split_d["status"] == 4
+        assert split_d["operation_ts"] == op_ts
+        assert "added_edges" not in split_d
+
+        # logs keep the order of the rows
+        logs = build_operation_logs([split, merge, split])
+        assert [type(log) for log in logs] == [SplitLog, MergeLog, SplitLog]
+
+
+class TestRepairGroups:
+    @pytest.mark.timeout(30)
+    def test_group_by_roots(self):
+        roots = [{1}, {2}, {1, 3}, {4}, {3, 5}, set(), {5}, {6, 7}]
+        assert _group_by_roots(roots) == [[0, 2, 4, 6], [1], [3], [5], [7]]
+
+    @pytest.mark.timeout(30)
+    def test_groups_joined_later(self):
+        # 0 and 1 are only connected through 2
+        assert _group_by_roots([{1}, {2}, {3}, {1, 2}]) == [[0, 1, 3], [2]]
+        assert _group_by_roots([{1}, {2}, {2, 3}, {3, 1}]) == [[0, 1, 2, 3]]
+        assert _group_by_roots([]) == []
+
+    @pytest.mark.timeout(30)
+    def test_order_within_groups(self):
+        # operations are replayed in the order of their indices within a group
+        rng = np.random.default_rng(0)
+        roots = [set(rng.integers(0, 50, 2).tolist()) for _ in range(200)]
+        groups = _group_by_roots(roots)
+        assert sorted(i for group in groups for i in group) == list(range(200))
+        for group in groups:
+            assert group == sorted(group)
+        for group_a in groups:
+            for group_b in groups:
+                if group_a is not group_b:
+                    roots_a = set().union(*(roots[i] for i in group_a))
+                    roots_b = set().union(*(roots[i] for i in group_b))
+                    assert not roots_a & roots_b
+
+    @pytest.mark.timeout(30)
+    def test_delete_keys_batches(self):
+        class _Client:
+            def __init__(self):
+                self.calls = []
+
+            def delete_multi(self, keys):
+                self.calls.append(list(keys))
+
+        for n_keys, sizes in [(0, []), (500, [500]), (1201, [500, 500, 201])]:
+            client = _Client()
+            _delete_keys(client, list(range(n_keys)))
+            assert [len(call) for call in client.calls] == sizes
+            assert sum(client.calls, []) == list(range(n_keys))
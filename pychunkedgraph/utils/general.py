@@ -35,3 +35,32 @@ def in2d(arr1: np.ndarray, arr2: np.ndarray) -> np.ndarray:
     arr1_view = arr1.view(dtype="u8,u8").reshape(arr1.shape[0])
     arr2_view = arr2.view(dtype="u8,u8").reshape(arr2.shape[0])
     return np.in1d(arr1_view, arr2_view)
+
+
+def unique_rows(arr: np.ndarray) -> np.ndarray:
+    """
+    Same result as `np.unique(arr, axis=0)` for (n, 2) arrays, rows sorted.
+    `np.unique` with `axis` sorts a structured view which is much slower.
+    """
+    if not arr.size:
+        return arr
+    arr = arr[np.lexsort((arr[:, 1], arr[:, 0]))]
+    mask = np.empty(arr.shape[0], dtype=bool)
+    mask[0] = True
+    mask[1:] = (arr[1:, 0] != arr[:-1, 0]) | (arr[1:, 1] != arr[:-1, 1])
+    return arr[mask]
+
+
+def unique_1d(arr: np.ndarray) -> np.ndarray:
+    """
+    Same result as `np.unique(arr)` for 1d integer arrays.
+    Skips the sort when `arr` is already sorted, like concatenated sorted IDs.
+    """
+    if arr.size < 2:
+        return arr.copy()
+    if not np.all(arr[1:] >= arr[:-1]):
+        arr = np.sort(arr)
+    mask = np.empty(arr.size, dtype=bool)
+    mask[0] = True
+    np.not_equal(arr[1:], arr[:-1], out=mask[1:])
+    return arr[mask]
@@ -2,9 +2,16 @@
 
 import gc
 import pickle
+import signal
 import logging
 from os import path
 from os import getenv
+from itertools import count
+from time import sleep
+from threading import Lock
+from threading import Event
+from threading import Thread
+from typing import NamedTuple
 
 import numpy as np
 from messagingclient import MessagingClient
@@ -14,34 +21,50 @@ from pychunkedgraph.graph.utils import basetypes
 from pychunkedgraph.meshing import meshgen
 
 
+INFO_HIGH = 25
+logging.basicConfig(
+    level=INFO_HIGH,
+    format="%(asctime)s %(message)s",
+    datefmt="%m/%d/%Y %I:%M:%S %p",
+)
+
+
+class CGEntry(NamedTuple):
+    """Per table state, fixed for the lifetime of a graph."""
+
+    cg: ChunkedGraph
+    layer: int
+    mip: int
+    err: int
+    mesh_dir: str
+    mesh_path: str
+
+
+# table_id -> CGEntry, None for tables without mesh metadata
 PCG_CACHE = {}
+PCG_CACHE_LOCK = Lock()
 
+# seconds to wait for more messages of the same table before remeshing
+# their l2ids together, only useful with PYCHUNKEDGRAPH_REMESH_CONCURRENCY > 1
+COALESCE_WINDOW = float(getenv("PYCHUNKEDGRAPH_REMESH_COALESCE_WINDOW", 0))
+# table_id -> batch of messages waiting for the window to close
+PENDING = {}
+PENDING_LOCK = Lock()
 
-def callback(payload):
-    data = pickle.loads(payload.data)
-    op_id = int(data["operation_id"])
-    l2ids = np.array(data["new_lvl2_ids"], dtype=basetypes.NODE_ID)
-    table_id = payload.attributes["table_id"]
+# full collection every n messages instead of after each one
+GC_INTERVAL = int(getenv("PYCHUNKEDGRAPH_REMESH_GC_INTERVAL", 64))
+MESSAGE_COUNT = count(1)
 
-    try:
-        cg = PCG_CACHE[table_id]
-    except KeyError:
-        cg = ChunkedGraph(graph_id=table_id)
-        PCG_CACHE[table_id] = cg
-
-    INFO_HIGH = 25
-    logging.basicConfig(
-        level=INFO_HIGH,
-        format="%(asctime)s %(message)s",
-        datefmt="%m/%d/%Y %I:%M:%S %p",
-    )
 
+def _build_cache_entry(table_id: str):
+    """Mesh config is fixed for the lifetime of a graph, resolve it once per table."""
+    cg = ChunkedGraph(graph_id=table_id)
     try:
         mesh_dir = cg.meta.dataset_info["mesh"]
         cv_unsharded_mesh_dir = cg.meta.dataset_info["mesh_metadata"]["unsharded_mesh_dir"]
     except KeyError:
         logging.warning(f"No metadata found for {cg.graph_id}; ignoring...")
-        return
+        return None
 
     mesh_path = path.join(
         cg.meta.data_source.WATERSHED, mesh_dir, cv_unsharded_mesh_dir
@@ -53,24 +76,165 @@ def callback(payload):
         mip = mesh_data["mip"]
         err = mesh_data["max_error"]
     except KeyError:
-        return
+        return None
+    return CGEntry(cg, layer, mip, err, mesh_dir, mesh_path)
 
 
-    logging.log(INFO_HIGH, f"remeshing {l2ids}; graph {table_id} operation {op_id}.")
+class _Batch:
+    def __init__(self):
+        self.op_ids = []
+        self.l2ids = []
+        self.done = Event()
+        self.error = None
+
+
+def _remesh(entry: CGEntry, table_id: str, op_ids, l2ids: np.ndarray):
+    if not len(l2ids):
+        return
+    # count and bounds only, the repr of large l2ids arrays is not cheap
+    logging.log(
+        INFO_HIGH,
+        "remeshing %s l2ids [%s ... %s]; graph %s operation %s.",
+        len(l2ids),
+        l2ids[0],
+        l2ids[-1],
+        table_id,
+        op_ids,
+    )
     meshgen.remeshing(
-        cg,
+        entry.cg,
         l2ids,
-        stop_layer=layer,
-        mip=mip,
-        max_err=err,
-        cv_sharded_mesh_dir=mesh_dir,
-        cv_unsharded_mesh_path=mesh_path,
+        stop_layer=entry.layer,
+        mip=entry.mip,
+        max_err=entry.err,
+        cv_sharded_mesh_dir=entry.mesh_dir,
+        cv_unsharded_mesh_path=entry.mesh_path,
     )
-    logging.log(INFO_HIGH, f"remeshing complete; graph {table_id} operation {op_id}.")
-    gc.collect()
+    logging.log(
+        INFO_HIGH, "remeshing complete; graph %s operation %s.", table_id, op_ids
+    )
+
+
+def _remesh_coalesced(entry: CGEntry, table_id: str, op_id: int, l2ids: np.ndarray):
+    """
+    The first message of a table waits for `COALESCE_WINDOW` and remeshes
+    the union of l2ids of all messages that arrived meanwhile.
+    The others wait for it and fail with it, so they are not acked either.
+    """
+    with PENDING_LOCK:
+        batch = PENDING.get(table_id)
+        leader = batch is None
+        if leader:
+            batch = PENDING[table_id] = _Batch()
+        batch.op_ids.append(op_id)
+        batch.l2ids.append(l2ids)
+
+    if not leader:
+        batch.done.wait()
+        if batch.error is not None:
+            raise batch.error
+        return
+
+    sleep(COALESCE_WINDOW)
+    with PENDING_LOCK:
+        del PENDING[table_id]
+    try:
+        _remesh(entry, table_id, batch.op_ids, np.unique(np.concatenate(batch.l2ids)))
+    except Exception as err:
+        batch.error = err
+        raise
+    finally:
+        batch.done.set()
+
+
+def callback(payload):
+    data = pickle.loads(payload.data)
+    op_id = int(data["operation_id"])
+    new_lvl2_ids = data["new_lvl2_ids"]
+    # known length, output is allocated once
+    l2ids = np.fromiter(new_lvl2_ids, dtype=basetypes.NODE_ID, count=len(new_lvl2_ids))
+    l2ids = np.unique(l2ids)
+    if len(l2ids) < len(new_lvl2_ids):
+        n_duplicates = len(new_lvl2_ids) - len(l2ids)
+        logging.warning("operation %s sent %s duplicate l2ids.", op_id, n_duplicates)
+    table_id = payload.attributes["table_id"]
+
+    try:
+        entry = PCG_CACHE[table_id]
+    except KeyError:
+        # messages are handled concurrently, build each entry only once
+        with PCG_CACHE_LOCK:
+            if table_id not in PCG_CACHE:
+                PCG_CACHE[table_id] = _build_cache_entry(table_id)
+            entry = PCG_CACHE[table_id]
+
+    if entry is None:
+        return
 
+    if COALESCE_WINDOW > 0:
+        _remesh_coalesced(entry, table_id, op_id, l2ids)
+    else:
+        _remesh(entry, table_id, op_id, l2ids)
+    if next(MESSAGE_COUNT) % GC_INTERVAL == 0:
+        gc.collect()
+
+
+def _preload_entries() -> dict:
+    """
+    Builds entries for tables listed in PYCHUNKEDGRAPH_REMESH_PRELOAD_TABLES,
+    so first messages of those tables don't construct a ChunkedGraph inline.
+    """
+    entries = {}
+    tables = getenv("PYCHUNKEDGRAPH_REMESH_PRELOAD_TABLES", "")
+    for table_id in filter(None, (t.strip() for t in tables.split(","))):
+        entries[table_id] = _build_cache_entry(table_id)
+    return entries
+
+
+def _reload_cache():
+    """Drops cached graphs without a restart, preloaded tables are rebuilt first."""
+    global PCG_CACHE
+    entries = _preload_entries()
+    with PCG_CACHE_LOCK:
+        # old entries were frozen at startup, they can't be collected otherwise
+        gc.unfreeze()
+        PCG_CACHE = entries
+    logging.log(INFO_HIGH, "reloaded cache; %s tables.", len(entries))
+
+
+def _on_sighup(*_):
+    # building entries reads from bigtable, keep that out of the signal handler
+    Thread(target=_reload_cache, daemon=True).start()
+
+
+def _parse_cpus(cpus: str) -> set:
+    """CPU list like `0-3,6` -> {0, 1, 2, 3, 6}"""
+    result = set()
+    for part in filter(None, (p.strip() for p in cpus.split(","))):
+        start, _, end = part.partition("-")
+        result.update(range(int(start), int(end or start) + 1))
+    return result
+
+
+# optional, pins the worker and threads started after this (subscriber, grpc)
+# to a fixed set of cores, e.g. to keep it off cores of other pods on the node
+remesh_cpus = _parse_cpus(getenv("PYCHUNKEDGRAPH_REMESH_CPUS", ""))
+if remesh_cpus:
+    # linux only, keep the worker importable elsewhere
+    from os import sched_setaffinity
+
+    sched_setaffinity(0, remesh_cpus)
+
+PCG_CACHE.update(_preload_entries())
+# preloaded graphs and imports live as long as the worker, freeze them once
+# so periodic collections don't traverse them; entries built later are not
+gc.freeze()
+signal.signal(signal.SIGHUP, _on_sighup)
 
 c = MessagingClient()
 remesh_queue = getenv("PYCHUNKEDGRAPH_REMESH_QUEUE")
 assert remesh_queue is not None, "env PYCHUNKEDGRAPH_REMESH_QUEUE not specified."
-c.consume(remesh_queue, callback)
+# messages handled at once, the subscriber runs callbacks on its own thread pool
+# and flow control holds back further messages until one is acked
+remesh_concurrency = int(getenv("PYCHUNKEDGRAPH_REMESH_CONCURRENCY", 1))
+c.consume(remesh_queue, callback, max_messages=remesh_concurrency)